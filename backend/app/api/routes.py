@@ -2,19 +2,27 @@
 from __future__ import annotations
 
 import asyncio
-from typing import AsyncIterator, List
-
-from fastapi import APIRouter, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
-
-from backend.app.core.database import get_session as db_session
-from backend.app.domain.discussion import AgentTurn, DiscussionSession, ToolResult
-from backend.app.schemas import api as api_schemas, models
+import threading
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, List, Tuple
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from backend.app.core import serialization
+from backend.app.core.lifespan import lifespan
+from backend.app.domain.discussion import AgentTurn, DiscussionSession, JudgeVerdict, ToolResult
+from backend.app.schemas import api as api_schemas
 from backend.app.workers.judges import CommitteeJudge, JudgeCommitteeConfig, LLMClient, RuleValidator
 from backend.app.workers.reflection import DefaultReflectionEngine
 from backend.app.workers.socratic import SocraticOrchestrator
 
 router = APIRouter()
 
+# Updates arriving within this window are folded into a single snapshot frame.
+SNAPSHOT_COALESCE_SECONDS = 0.01
+
 
 class EchoAgent:
     """Simple agent used for bootstrapping the API."""
@@ -67,73 +75,205 @@ class NonEmptyValidator(RuleValidator):
 
 
 _orchestrator: SocraticOrchestrator | None = None
+_orchestrator_lock = threading.Lock()
+_session_listeners: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+
+def get_or_create_event(session_id: str) -> asyncio.Event:
+    """Register an update event for the calling stream on the running loop."""
+    event = asyncio.Event()
+    listener = (asyncio.get_running_loop(), event)
+    _session_listeners.setdefault(session_id, []).append(listener)
+    return event
+
+
+def release_event(session_id: str, event: asyncio.Event) -> None:
+    listeners = _session_listeners.get(session_id, [])
+    listeners[:] = [listener for listener in listeners if listener[1] is not event]
+    if not listeners:
+        _session_listeners.pop(session_id, None)
+
+
+def notify_session_update(session_model: DiscussionSession) -> None:
+    """Wake every stream watching the session; safe to call from worker threads."""
+    for loop, event in list(_session_listeners.get(session_model.session_id, ())):
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
 
 
 def get_orchestrator() -> SocraticOrchestrator:
+    """Return the shared orchestrator, building it once even under concurrent first requests."""
     global _orchestrator
     if _orchestrator is None:
-        agent = EchoAgent()
-        tool = EchoTool()
-        judge = CommitteeJudge(
-            JudgeCommitteeConfig(
-                committee_id="default-committee",
-                llm_clients=[SimpleLLM()],
-                validators=[NonEmptyValidator()],
-            )
-        )
-        _orchestrator = SocraticOrchestrator(
-            agents=[agent],
-            tools=[tool],
-            judges=[judge],
-            reflection_engine=DefaultReflectionEngine(),
-        )
+        # Sync routes run in the threadpool, so guard with a thread lock rather than an asyncio one.
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = _build_orchestrator()
     return _orchestrator
 
 
+def _build_orchestrator() -> SocraticOrchestrator:
+    agent = EchoAgent()
+    tool = EchoTool()
+    judge = CommitteeJudge(
+        JudgeCommitteeConfig(
+            committee_id="default-committee",
+            llm_clients=[SimpleLLM()],
+            validators=[NonEmptyValidator()],
+        )
+    )
+    return SocraticOrchestrator(
+        agents=[agent],
+        tools=[tool],
+        judges=[judge],
+        reflection_engine=DefaultReflectionEngine(),
+        on_update=notify_session_update,
+    )
+
+
 @router.post("/sessions", response_model=api_schemas.DiscussionSessionView)
-def create_session(payload: api_schemas.CreateSessionRequest) -> api_schemas.DiscussionSessionView:
-    orchestrator = get_orchestrator()
+def create_session(
+    payload: api_schemas.CreateSessionRequest,
+    orchestrator: SocraticOrchestrator = Depends(get_orchestrator),
+) -> api_schemas.DiscussionSessionView:
     session_model = orchestrator.load_or_create_session(payload.session_id, payload.topic)
     return serialize_session(session_model)
 
 
 @router.post("/sessions/{session_id}/round", response_model=api_schemas.DiscussionSessionView)
-def run_round(session_id: str, payload: api_schemas.RoundRequest) -> api_schemas.DiscussionSessionView:
-    orchestrator = get_orchestrator()
+def run_round(
+    session_id: str,
+    payload: api_schemas.RoundRequest,
+    orchestrator: SocraticOrchestrator = Depends(get_orchestrator),
+) -> api_schemas.DiscussionSessionView:
     session_model = orchestrator.run_round(session_id=session_id, topic=payload.topic)
     return serialize_session(session_model)
 
 
 @router.get("/sessions/{session_id}", response_model=api_schemas.DiscussionSessionView)
-def get_session(session_id: str) -> api_schemas.DiscussionSessionView:
-    orchestrator = get_orchestrator()
-    with db_session() as session:
-        record = session.get(models.DiscussionSessionRecord, session_id)
-        if record is None:
-            raise HTTPException(status_code=404, detail="Session not found")
-        topic = record.topic
-    session_model = orchestrator.load_or_create_session(session_id, topic=topic)
+async def get_session(
+    session_id: str,
+    orchestrator: SocraticOrchestrator = Depends(get_orchestrator),
+) -> api_schemas.DiscussionSessionView:
+    session_model = await orchestrator.aload_session(session_id)
+    if session_model is None:
+        raise HTTPException(status_code=404, detail="Session not found")
     return serialize_session(session_model)
 
 
-async def stream_session(session_id: str) -> AsyncIterator[api_schemas.DiscussionSessionView]:
-    orchestrator = get_orchestrator()
-    while True:
-        await asyncio.sleep(1)
-        session_model = orchestrator.load_or_create_session(session_id, topic="")
-        yield serialize_session(session_model)
+@dataclass
+class SnapshotCursor:
+    """Tracks how much of a session a websocket client has already received."""
+
+    version: int = 0
+    turns: int = 0
+    verdicts: int = 0
+
+
+async def stream_session(
+    orchestrator: SocraticOrchestrator, session_id: str
+) -> AsyncGenerator[DiscussionSession, None]:
+    event = get_or_create_event(session_id)
+    try:
+        while True:
+            session_model = await orchestrator.aload_session(session_id)
+            if session_model is not None:
+                yield session_model
+            await event.wait()
+            await asyncio.sleep(SNAPSHOT_COALESCE_SECONDS)
+            event.clear()
+    finally:
+        release_event(session_id, event)
 
 
 @router.websocket("/ws/sessions/{session_id}")
-async def session_updates(websocket: WebSocket, session_id: str) -> None:
+async def session_updates(
+    websocket: WebSocket,
+    session_id: str,
+    orchestrator: SocraticOrchestrator = Depends(get_orchestrator),
+) -> None:
     await websocket.accept()
+    cursor = SnapshotCursor()
+    last_version = None
     try:
-        async for snapshot in stream_session(session_id):
-            await websocket.send_json(snapshot.dict())
+        async with aclosing(stream_session(orchestrator, session_id)) as snapshots:
+            async for session_model in snapshots:
+                version = (
+                    session_model.updated_at,
+                    len(session_model.turns),
+                    len(session_model.judge_events),
+                )
+                if version == last_version:
+                    continue
+                last_version = version
+                delta = serialize_session_delta(session_model, cursor)
+                await websocket.send_bytes(serialization.dumps(delta))
     except WebSocketDisconnect:
         return
 
 
+def serialize_session_delta(session_model: DiscussionSession, cursor: SnapshotCursor) -> Dict[str, Any]:
+    """Serialize only what changed since ``cursor`` and advance it.
+
+    Clients replace their turns from ``turns_from`` onwards with ``turns`` and append
+    ``verdicts_append``; the first frame sent with a fresh cursor is a full snapshot.
+    Turns that were still open when last sent are re-sent because tools and responses
+    are attached to them after they start.
+    """
+    turns_from = cursor.turns
+    new_turns = session_model.turns[turns_from:]
+    new_verdicts = session_model.judge_events[cursor.verdicts:]
+    delta = {
+        "base_version": cursor.version,
+        "version": cursor.version + 1,
+        "session_id": session_model.session_id,
+        "topic": session_model.topic,
+        "current_phase": session_model.current_phase,
+        "created_at": session_model.created_at,
+        "updated_at": session_model.updated_at,
+        "turns_from": turns_from,
+        "turns": [_turn_payload(turn) for turn in new_turns],
+        "verdicts_append": [_verdict_payload(verdict) for verdict in new_verdicts],
+    }
+
+    cursor.version += 1
+    cursor.turns = session_model.turn_columns.first_open(turns_from)
+    cursor.verdicts += len(new_verdicts)
+    return delta
+
+
+# The websocket path builds plain dicts shaped like the API views and hands them
+# straight to the JSON encoder; pydantic validation is kept for the HTTP routes.
+def _turn_payload(turn: AgentTurn) -> Dict[str, Any]:
+    return {
+        "agent_id": turn.agent_id,
+        "prompt": turn.prompt,
+        "response": turn.response,
+        "reflections": list(turn.reflections),
+        "created_at": turn.created_at,
+        "completed_at": turn.completed_at,
+        "tool_results": [
+            {
+                "tool_name": result.tool_name,
+                "output": result.output,
+                "metadata": result.metadata,
+                "created_at": result.created_at,
+            }
+            for result in turn.tool_results
+        ],
+    }
+
+
+def _verdict_payload(verdict: JudgeVerdict) -> Dict[str, Any]:
+    return {
+        "judge_id": verdict.judge_id,
+        "summary": verdict.summary,
+        "open_issues": list(verdict.open_issues),
+        "metadata": verdict.metadata,
+        "created_at": verdict.created_at,
+    }
+
+
 def serialize_session(session_model: DiscussionSession) -> api_schemas.DiscussionSessionView:
     return api_schemas.DiscussionSessionView(
         session_id=session_model.session_id,
@@ -141,40 +281,46 @@ def serialize_session(session_model: DiscussionSession) -> api_schemas.Discussio
         current_phase=session_model.current_phase,
         created_at=session_model.created_at,
         updated_at=session_model.updated_at,
-        turns=[
-            api_schemas.AgentTurnView(
-                agent_id=turn.agent_id,
-                prompt=turn.prompt,
-                response=turn.response,
-                reflections=list(turn.reflections),
-                created_at=turn.created_at,
-                completed_at=turn.completed_at,
-                tool_results=[
-                    api_schemas.ToolResultView(
-                        tool_name=result.tool_name,
-                        output=result.output,
-                        metadata=result.metadata,
-                        created_at=result.created_at,
-                    )
-                    for result in turn.tool_results
-                ],
-            )
-            for turn in session_model.turns
-        ],
-        judge_events=[
-            api_schemas.JudgeVerdictView(
-                judge_id=verdict.judge_id,
-                summary=verdict.summary,
-                open_issues=list(verdict.open_issues),
-                metadata=verdict.metadata,
-                created_at=verdict.created_at,
+        turns=[serialize_turn(turn) for turn in session_model.turns],
+        judge_events=[serialize_verdict(verdict) for verdict in session_model.judge_events],
+    )
+
+
+def serialize_turn(turn: AgentTurn) -> api_schemas.AgentTurnView:
+    return api_schemas.AgentTurnView(
+        agent_id=turn.agent_id,
+        prompt=turn.prompt,
+        response=turn.response,
+        reflections=list(turn.reflections),
+        created_at=turn.created_at,
+        completed_at=turn.completed_at,
+        tool_results=[
+            api_schemas.ToolResultView(
+                tool_name=result.tool_name,
+                output=result.output,
+                metadata=result.metadata,
+                created_at=result.created_at,
             )
-            for verdict in session_model.judge_events
+            for result in turn.tool_results
         ],
     )
 
 
-app = FastAPI(title="Socratic Method Service")
+def serialize_verdict(verdict: JudgeVerdict) -> api_schemas.JudgeVerdictView:
+    return api_schemas.JudgeVerdictView(
+        judge_id=verdict.judge_id,
+        summary=verdict.summary,
+        open_issues=list(verdict.open_issues),
+        metadata=verdict.metadata,
+        created_at=verdict.created_at,
+    )
+
+
+app = FastAPI(
+    title="Socratic Method Service",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if serialization.ORJSON_AVAILABLE else JSONResponse,
+)
 app.include_router(router)
 
 
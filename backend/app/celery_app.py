@@ -1,14 +1,42 @@
 """Celery application configuration."""
 
-from celery import Celery
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .config import get_settings
 
-settings = get_settings()
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from celery import Celery
 
-celery_app = Celery(
-    "socratic-backend",
-    broker=settings.celery_broker_url,
-    backend=settings.celery_result_backend,
-)
-celery_app.autodiscover_tasks(["app.tasks"])
+
+@lru_cache(maxsize=1)
+def create_celery() -> "Celery":
+    """Build the Celery application on first use so importing this module stays cheap."""
+
+    from celery import Celery
+
+    settings = get_settings()
+    app = Celery(
+        "socratic-backend",
+        broker=settings.celery_broker_url,
+        backend=settings.celery_result_backend,
+    )
+    app.conf.update(
+        broker_pool_limit=settings.celery_broker_pool_limit,
+        broker_transport_options={
+            "max_connections": settings.celery_redis_max_connections,
+            "socket_keepalive": True,
+        },
+        result_backend_transport_options={"max_connections": settings.celery_redis_max_connections},
+        redis_max_connections=settings.celery_redis_max_connections,
+        redis_socket_keepalive=True,
+    )
+    app.autodiscover_tasks(["app.tasks"])
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # ``celery -A app.celery_app.celery_app`` resolves the attribute through here.
+    if name == "celery_app":
+        return create_celery()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
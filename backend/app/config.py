@@ -1,5 +1,7 @@
 """Runtime configuration for the backend service."""
 
+from functools import lru_cache
+
 from pydantic import BaseSettings, Field
 
 
@@ -9,12 +11,16 @@ class Settings(BaseSettings):
     app_name: str = Field(default="Socratic Workspace API")
     celery_broker_url: str = Field(default="redis://localhost:6379/0")
     celery_result_backend: str = Field(default="redis://localhost:6379/1")
+    celery_broker_pool_limit: int = Field(default=50)
+    celery_redis_max_connections: int = Field(default=100)
+    judge_max_workers: int = Field(default=16)
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Return cached application settings instance."""
 
@@ -0,0 +1,25 @@
+"""String interning for identifiers that repeat across many records."""
+from __future__ import annotations
+
+import sys
+from typing import Optional, overload
+
+# Interning lets repeated ids (agents, tools, providers) share one string object per distinct
+# value. Long values are unlikely to repeat and are left alone.
+INTERN_MAX_LENGTH = 64
+
+
+@overload
+def intern_identifier(value: str) -> str:
+    ...
+
+
+@overload
+def intern_identifier(value: None) -> None:
+    ...
+
+
+def intern_identifier(value: Optional[str]) -> Optional[str]:
+    if value is not None and len(value) < INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
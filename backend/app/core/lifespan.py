@@ -0,0 +1,20 @@
+"""Application lifespan shared by every FastAPI entry point."""
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from ..observability.metrics import flush_discussion_costs
+from ..providers import aclose_http_clients
+from ..workers.judges import shutdown_judge_executor
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Release process-wide resources when the service shuts down."""
+    yield
+    await flush_discussion_costs()
+    await aclose_http_clients()
+    shutdown_judge_executor()
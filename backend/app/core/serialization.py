@@ -0,0 +1,51 @@
+"""JSON encoding helpers that prefer orjson and fall back to the standard library."""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+orjson: Optional[ModuleType]
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+else:
+    orjson = _orjson
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def _stdlib_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(
+    obj: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(
+        obj,
+        default=default or _stdlib_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["ORJSON_AVAILABLE", "dumps", "loads"]
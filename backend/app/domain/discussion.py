@@ -34,6 +34,7 @@ class ToolResult:
     output: str
     metadata: dict = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
+    record_id: Optional[int] = None
 
 
 @dataclass(slots=True)
@@ -47,6 +48,7 @@ class AgentTurn:
     created_at: datetime = field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = None
     tool_results: List[ToolResult] = field(default_factory=list)
+    record_id: Optional[int] = None
 
 
 @dataclass(slots=True)
@@ -58,6 +60,28 @@ class JudgeVerdict:
     open_issues: Sequence[str] = field(default_factory=tuple)
     metadata: dict = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
+    record_id: Optional[int] = None
+
+
+@dataclass(slots=True)
+class TurnColumns:
+    """Column-oriented copy of per-turn metadata for scans that skip the turn objects."""
+
+    agent_ids: List[str] = field(default_factory=list)
+    created_at: List[datetime] = field(default_factory=list)
+    completed_at: List[Optional[datetime]] = field(default_factory=list)
+
+    def append(self, turn: AgentTurn) -> None:
+        self.agent_ids.append(turn.agent_id)
+        self.created_at.append(turn.created_at)
+        self.completed_at.append(turn.completed_at)
+
+    def first_open(self, start: int = 0) -> int:
+        """Index of the first turn at or after ``start`` still awaiting a response."""
+        try:
+            return self.completed_at.index(None, start)
+        except ValueError:
+            return len(self.completed_at)
 
 
 @dataclass(slots=True)
@@ -72,17 +96,20 @@ class DiscussionSession:
     turns: List[AgentTurn] = field(default_factory=list)
     tool_events: List[PhaseEvent] = field(default_factory=list)
     judge_events: List[JudgeVerdict] = field(default_factory=list)
+    turn_columns: TurnColumns = field(default_factory=TurnColumns)
 
     def start_agent_turn(self, agent_id: str, prompt: str) -> AgentTurn:
         """Start a new agent turn and transition the phase."""
-        turn = AgentTurn(agent_id=agent_id, prompt=prompt)
+        now = datetime.utcnow()
+        turn = AgentTurn(agent_id=agent_id, prompt=prompt, created_at=now)
         self.turns.append(turn)
+        self.turn_columns.append(turn)
         self.current_phase = DiscussionPhase.AGENT_TURN
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         self.tool_events.append(
             PhaseEvent(
                 phase=self.current_phase,
-                timestamp=self.updated_at,
+                timestamp=now,
                 payload={"agent_id": agent_id, "prompt": prompt},
                 actor=agent_id,
             )
@@ -95,12 +122,12 @@ class DiscussionSession:
             raise ValueError("Cannot record tool result without an active turn")
         self.turns[-1].tool_results.append(tool_result)
         self.current_phase = DiscussionPhase.TOOL_INVOCATION
-        timestamp = datetime.utcnow()
-        self.updated_at = timestamp
+        now = datetime.utcnow()
+        self.updated_at = now
         self.tool_events.append(
             PhaseEvent(
                 phase=self.current_phase,
-                timestamp=timestamp,
+                timestamp=now,
                 payload={"tool": tool_result.tool_name, "metadata": tool_result.metadata},
                 actor=tool_result.metadata.get("invoked_by"),
             )
@@ -114,8 +141,10 @@ class DiscussionSession:
         turn.response = response
         if reflections:
             turn.reflections = tuple(reflections)
-        turn.completed_at = datetime.utcnow()
-        self.updated_at = turn.completed_at
+        now = datetime.utcnow()
+        turn.completed_at = now
+        self.turn_columns.completed_at[-1] = now
+        self.updated_at = now
 
     def add_judge_verdict(self, verdict: JudgeVerdict) -> None:
         """Record a judge verdict and update phase tracking."""
@@ -125,4 +154,6 @@ class DiscussionSession:
 
     def history(self) -> List[PhaseEvent]:
         """Return a chronological list of phase events for auditing."""
-        return sorted(self.tool_events, key=lambda event: event.timestamp)
+        # Events are appended as they happen and hydrated in occurred_at order,
+        # so the log is already chronological.
+        return list(self.tool_events)
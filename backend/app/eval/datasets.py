@@ -4,10 +4,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from typing import Any, Iterable, List, Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
     """Represents a historical market event for evaluation."""
 
@@ -19,17 +19,7 @@ class MarketEvent:
 
 
 def load_events_from_file(path: str | Path) -> List[MarketEvent]:
-    data = json.loads(Path(path).read_text())
-    return [
-        MarketEvent(
-            name=item["name"],
-            date=item.get("date", ""),
-            description=item.get("description", ""),
-            expected_outcomes=item.get("expected_outcomes", {}),
-            prompts=item.get("prompts", []),
-        )
-        for item in data
-    ]
+    return load_events(json.loads(Path(path).read_text()))
 
 
 def load_events(events: Iterable[Mapping[str, Any]]) -> List[MarketEvent]:
@@ -2,14 +2,43 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Iterable, List, Mapping
+from typing import Iterable, List, Mapping, Sequence
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
 
 
 def correctness_score(predictions: Iterable[Mapping[str, float]], expected: Mapping[str, float]) -> float:
     """Compute a correctness score (0-1) based on closeness to expected outcomes."""
+    preds = list(predictions)
+    if not preds or not expected:
+        return 0.0
+    if np is None:
+        return _correctness_score_py(preds, expected)
+
+    keys = list(expected)
+    expected_values = np.fromiter(expected.values(), dtype=np.float64, count=len(keys))
+    # Missing keys become NaN and are masked out of the mean.
+    predicted = np.array(
+        [[pred.get(key, np.nan) for key in keys] for pred in preds],
+        dtype=np.float64,
+    )
+    present = ~np.isnan(predicted)
+    if not present.any():
+        return 0.0
+    scale = np.abs(expected_values)
+    relative = np.maximum(0.0, 1.0 - np.abs(predicted - expected_values) / np.where(scale == 0, 1.0, scale))
+    exact_zero = (np.abs(predicted) < 1e-6).astype(np.float64)
+    scores = np.where(scale == 0, exact_zero, relative)
+    return float(scores[present].mean())
+
+
+def _correctness_score_py(preds: Sequence[Mapping[str, float]], expected: Mapping[str, float]) -> float:
     total = 0.0
     count = 0
-    for pred in predictions:
+    for pred in preds:
         for key, expected_value in expected.items():
             if key not in pred:
                 continue
@@ -28,11 +57,9 @@ def diversity_score(opinions: Iterable[Mapping[str, str]]) -> float:
     stances: List[str] = [opinion.get("stance", "unknown") for opinion in opinions]
     if not stances:
         return 0.0
-    counts = Counter(stances)
-    total = sum(counts.values())
+    total = len(stances)
     # Simpson diversity index complement
-    diversity = 1.0 - sum((count / total) ** 2 for count in counts.values())
-    return diversity
+    return 1.0 - sum(count * count for count in Counter(stances).values()) / (total * total)
 
 
 __all__ = ["correctness_score", "diversity_score"]
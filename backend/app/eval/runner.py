@@ -1,9 +1,11 @@
 """Evaluation harness for running regression suites on historical events."""
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List, Mapping, Protocol
+from typing import Any, Awaitable, Iterable, List, Mapping, Protocol, cast
 
 from .datasets import MarketEvent
 from .metrics import correctness_score, diversity_score
@@ -37,25 +39,44 @@ class EvaluationHarness:
         results: List[EvaluationResult] = []
         for event in events:
             logger.info("Running evaluation for event=%s", event.name)
-            payload = self.analyst.analyze_event(event)
-            opinions = list(payload.get(self.opinion_key, []))
-            predictions = [opinion.get("predictions", {}) for opinion in opinions]
-            correctness = correctness_score(predictions, event.expected_outcomes)
-            diversity = diversity_score(opinions)
-            result = EvaluationResult(
-                event=event,
-                correctness=correctness,
-                diversity=diversity,
-                raw_opinions=opinions,
-            )
-            results.append(result)
-            logger.debug(
-                "Evaluation completed for %s correctness=%.3f diversity=%.3f",
-                event.name,
-                correctness,
-                diversity,
-            )
+            results.append(self._score(event, self.analyst.analyze_event(event)))
         return results
 
+    async def run_async(self, events: Iterable[MarketEvent], *, concurrency: int = 16) -> List[EvaluationResult]:
+        """Evaluate events concurrently; results keep the input order."""
+        semaphore = asyncio.Semaphore(concurrency)
+        analyze = self.analyst.analyze_event
+        is_async = inspect.iscoroutinefunction(analyze)
+
+        async def _run_one(event: MarketEvent) -> EvaluationResult:
+            async with semaphore:
+                logger.info("Running evaluation for event=%s", event.name)
+                if is_async:
+                    # Coroutine analysts satisfy the protocol structurally but return awaitables.
+                    payload = await cast(Awaitable[Mapping[str, Any]], analyze(event))
+                else:
+                    payload = await asyncio.to_thread(analyze, event)
+            return self._score(event, payload)
+
+        return list(await asyncio.gather(*(_run_one(event) for event in events)))
+
+    def _score(self, event: MarketEvent, payload: Mapping[str, Any]) -> EvaluationResult:
+        opinions = list(payload.get(self.opinion_key, []))
+        predictions = [opinion.get("predictions", {}) for opinion in opinions]
+        correctness = correctness_score(predictions, event.expected_outcomes)
+        diversity = diversity_score(opinions)
+        logger.debug(
+            "Evaluation completed for %s correctness=%.3f diversity=%.3f",
+            event.name,
+            correctness,
+            diversity,
+        )
+        return EvaluationResult(
+            event=event,
+            correctness=correctness,
+            diversity=diversity,
+            raw_opinions=opinions,
+        )
+
 
 __all__ = ["Analyst", "EvaluationResult", "EvaluationHarness"]
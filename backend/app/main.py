@@ -1,8 +1,11 @@
 """FastAPI application entry point."""
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .config import get_settings
+from .core.lifespan import lifespan
+from .core.serialization import ORJSON_AVAILABLE
 from .routers import topics
 
 
@@ -10,7 +13,11 @@ def create_app() -> FastAPI:
     """Application factory used for tests and worker processes."""
 
     settings = get_settings()
-    application = FastAPI(title=settings.app_name)
+    application = FastAPI(
+        title=settings.app_name,
+        default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
+        lifespan=lifespan,
+    )
     application.include_router(topics.router, prefix="/topics", tags=["topics"])
 
     @application.get("/health", tags=["health"])
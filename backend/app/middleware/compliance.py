@@ -1,18 +1,66 @@
 """Compliance middleware for redacting PII and tagging licenses."""
 from __future__ import annotations
 
-import json
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Iterable, Mapping, MutableMapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional
+
+from ..core import serialization
+
+try:  # pragma: no cover - optional dependency
+    import hyperscan  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
 
-EMAIL_RE = re.compile(r"(?P<email>[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,})", re.IGNORECASE)
-PHONE_RE = re.compile(r"(?P<phone>\+?\d[\d\-() ]{7,}\d)")
-SSN_RE = re.compile(r"(?P<ssn>\b\d{3}-\d{2}-\d{4}\b)")
+EMAIL_PATTERN = r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}"
+PHONE_PATTERN = r"\+?\d[\d\-() ]{7,}\d"
+SSN_PATTERN = r"\b\d{3}-\d{2}-\d{4}\b"
+
+EMAIL_RE = re.compile(f"(?P<email>{EMAIL_PATTERN})", re.IGNORECASE)
+PHONE_RE = re.compile(f"(?P<phone>{PHONE_PATTERN})")
+SSN_RE = re.compile(f"(?P<ssn>{SSN_PATTERN})")
+PII_RE = re.compile(
+    f"(?P<email>{EMAIL_PATTERN})|(?P<phone>{PHONE_PATTERN})|(?P<ssn>{SSN_PATTERN})",
+    re.IGNORECASE,
+)
+
+
+def _compile_prefilter() -> Any:
+    if hyperscan is None:
+        return None
+    patterns = (EMAIL_PATTERN, PHONE_PATTERN, SSN_PATTERN)
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode("ascii") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+        )
+    except Exception:  # pragma: no cover - depends on the installed hyperscan build
+        logger.debug("Hyperscan prefilter unavailable", exc_info=True)
+        return None
+    return database
+
+
+_PREFILTER = _compile_prefilter()
+
+
+def _may_contain_pii(value: str) -> bool:
+    """Cheap negative check; ASCII-only because hyperscan's ``\\d`` does not cover Unicode digits."""
+    if _PREFILTER is None or not value.isascii():
+        return True
+    hits: List[int] = []
+
+    def _on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+        hits.append(pattern_id)
+        return True  # stop scanning at the first hit
+
+    _PREFILTER.scan(value.encode("ascii"), match_event_handler=_on_match)
+    return bool(hits)
 
 
 @dataclass
@@ -43,13 +91,16 @@ class ComplianceMiddleware:
         self.logger = logger_ or logger
 
     def __call__(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        self.logger.debug("ComplianceMiddleware received request: %s", self._safe_json(request))
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("ComplianceMiddleware received request: %s", self._safe_json(request))
         processed_request = self._apply_license_tag(request)
         sanitized_request = self._redact(processed_request)
         response = self.app(sanitized_request)
         processed_response = self._apply_license_tag(response)
         sanitized_response = self._redact(processed_response)
-        self.logger.debug("ComplianceMiddleware response: %s", self._safe_json(sanitized_response))
+        if debug:
+            self.logger.debug("ComplianceMiddleware response: %s", self._safe_json(sanitized_response))
         return sanitized_response
 
     # Redaction utilities -------------------------------------------------
@@ -57,63 +108,53 @@ class ComplianceMiddleware:
         if not self.config.redact:
             return payload
 
-        redacted_payload = json.loads(json.dumps(payload))  # deep copy safe for json-like data
-        pii_matches = []
-        for key, value in self._walk_strings(redacted_payload):
-            for pattern, label in ((EMAIL_RE, "email"), (PHONE_RE, "phone"), (SSN_RE, "ssn")):
-                match_iter = list(pattern.finditer(value))
-                if not match_iter:
-                    continue
-                replacement = self.config.redact_replacements.get(label, "[redacted]")
-                new_value = pattern.sub(replacement, value)
-                self._assign(redacted_payload, key, new_value)
-                pii_matches.append({"field": key, "label": label, "count": len(match_iter)})
-                value = new_value
-
+        pii_matches: List[Dict[str, Any]] = []
+        redacted_payload = self._redact_node(payload, "", pii_matches)
         if pii_matches and self.config.log_pii_matches:
             self.logger.warning("PII redacted: %s", pii_matches)
         return redacted_payload
 
-    def _walk_strings(self, payload: Any, prefix: str = "") -> Iterable[tuple[str, str]]:
-        if isinstance(payload, str):
-            yield prefix or "root", payload
-        elif isinstance(payload, Mapping):
-            for key, value in payload.items():
-                new_prefix = f"{prefix}.{key}" if prefix else key
-                yield from self._walk_strings(value, new_prefix)
-        elif isinstance(payload, list):
-            for idx, value in enumerate(payload):
-                new_prefix = f"{prefix}[{idx}]"
-                yield from self._walk_strings(value, new_prefix)
-
-    def _assign(self, payload: Any, path: str, value: str) -> None:
-        parts = []
-        remainder = path
-        while remainder:
-            if remainder.endswith("]") and "[" in remainder:
-                idx = remainder.rfind("[")
-                parts.append(remainder[idx:])
-                remainder = remainder[:idx]
-            elif "." in remainder:
-                remainder, key = remainder.rsplit(".", 1)
-                parts.append(key)
-            else:
-                parts.append(remainder)
-                remainder = ""
-        parts.reverse()
-        target = payload
-        for part in parts[:-1]:
-            if part.startswith("["):
-                index = int(part.strip("[]"))
-                target = target[index]
-            else:
-                target = target[part]
-        last = parts[-1]
-        if last.startswith("["):
-            index = int(last.strip("[]"))
-            target[index] = value
-        else:
-            target[last] = value
+    def _redact_node(self, node: Any, path: str, pii_matches: List[Dict[str, Any]]) -> Any:
+        """Return ``node`` itself when clean, otherwise a copy rebuilt along the redacted path."""
+        if isinstance(node, str):
+            return self._redact_string(node, path or "root", pii_matches)
+        if isinstance(node, Mapping):
+            redacted: Optional[Dict[Any, Any]] = None
+            for key, value in node.items():
+                new_value = self._redact_node(value, f"{path}.{key}" if path else key, pii_matches)
+                if new_value is not value:
+                    if redacted is None:
+                        redacted = dict(node)
+                    redacted[key] = new_value
+            return node if redacted is None else redacted
+        if isinstance(node, list):
+            redacted_items: Optional[List[Any]] = None
+            for idx, value in enumerate(node):
+                new_value = self._redact_node(value, f"{path}[{idx}]", pii_matches)
+                if new_value is not value:
+                    if redacted_items is None:
+                        redacted_items = list(node)
+                    redacted_items[idx] = new_value
+            return node if redacted_items is None else redacted_items
+        return node
+
+    def _redact_string(self, value: str, path: str, pii_matches: List[Dict[str, Any]]) -> str:
+        if not _may_contain_pii(value):
+            return value
+        replacements = self.config.redact_replacements
+        counts: Dict[str, int] = {}
+
+        def _replace(match: re.Match[str]) -> str:
+            label = match.lastgroup or ""
+            counts[label] = counts.get(label, 0) + 1
+            return replacements.get(label, "[redacted]")
+
+        redacted = PII_RE.sub(_replace, value)
+        if not counts:
+            return value
+        for label, count in counts.items():
+            pii_matches.append({"field": path, "label": label, "count": count})
+        return redacted
 
     # License tagging -----------------------------------------------------
     def _apply_license_tag(self, payload: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
@@ -125,7 +166,7 @@ class ComplianceMiddleware:
     # Utilities -----------------------------------------------------------
     def _safe_json(self, payload: Any) -> str:
         try:
-            return json.dumps(payload, default=str)
+            return serialization.dumps(payload, default=str).decode("utf-8")
         except Exception:  # pragma: no cover - logging helper
             return str(payload)
 
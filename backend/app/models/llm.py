@@ -112,14 +112,14 @@ class Prompt:
         return compiled
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseUsage:
     input_tokens: int
     output_tokens: int
     cost: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseChunk:
     index: int
     content: str
@@ -1,8 +1,10 @@
 """Prometheus metrics for monitoring tool usage."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 try:
     from prometheus_client import Counter, Histogram  # type: ignore
@@ -29,22 +31,159 @@ if Counter and Histogram:
 else:
     TOOL_USAGE_COUNTER = TOOL_LATENCY_HISTOGRAM = DISCUSSION_COST_GAUGE = None  # type: ignore
 
+# Every distinct label value is a separate series held in memory and exported on each scrape.
+MAX_LABEL_VALUES = 200
+OVERFLOW_LABEL = "overflow"
 
-def observe_tool_usage(tool: str, adapter: str, latency: Optional[float] = None) -> None:
+
+class _LabelCap:
+    """Admits the first ``limit`` distinct values of a label and folds the rest into one series."""
+
+    __slots__ = ("name", "limit", "_seen", "_warned")
+
+    def __init__(self, name: str, limit: int = MAX_LABEL_VALUES) -> None:
+        self.name = name
+        self.limit = limit
+        self._seen: Set[str] = set()
+        self._warned = False
+
+    def __call__(self, value: str) -> str:
+        if value in self._seen:
+            return value
+        if len(self._seen) < self.limit:
+            self._seen.add(value)
+            return value
+        if not self._warned:
+            self._warned = True
+            logger.warning(
+                "Metric label %r exceeded %d distinct values; recording new values as %r",
+                self.name,
+                self.limit,
+                OVERFLOW_LABEL,
+            )
+        return OVERFLOW_LABEL
+
+
+_tool_label = _LabelCap("tool")
+_adapter_label = _LabelCap("adapter")
+_channel_label = _LabelCap("channel")
+
+# Child metrics resolved by ``.labels()``, keyed by the raw label values. Values folded into
+# the overflow series are not cached, so these stay within the label caps.
+_tool_handles: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+_cost_handles: Dict[str, Any] = {}
+
+
+def _tool_metric_handles(tool: str, adapter: str) -> Tuple[Any, Any]:
+    key = (tool, adapter)
+    handles = _tool_handles.get(key)
+    if handles is None:
+        tool_label = _tool_label(tool)
+        adapter_label = _adapter_label(adapter)
+        handles = (
+            TOOL_USAGE_COUNTER.labels(tool=tool_label, adapter=adapter_label),
+            TOOL_LATENCY_HISTOGRAM.labels(tool=tool_label, adapter=adapter_label),
+        )
+        if OVERFLOW_LABEL not in (tool_label, adapter_label):
+            _tool_handles[key] = handles
+    return handles
+
+
+def _observe_tool_usage(tool: str, adapter: str, latency: Optional[float] = None) -> None:
     """Record tool usage and latency."""
-    if not Counter or not Histogram:
-        logger.debug("Prometheus client not available; skipping metric record")
-        return
-    TOOL_USAGE_COUNTER.labels(tool=tool, adapter=adapter).inc()
+    counter, histogram = _tool_metric_handles(tool, adapter)
+    counter.inc()
     if latency is not None:
-        TOOL_LATENCY_HISTOGRAM.labels(tool=tool, adapter=adapter).observe(latency)
+        histogram.observe(latency)
+
+
+def _cost_handle(channel: str) -> Any:
+    handle = _cost_handles.get(channel)
+    if handle is None:
+        channel_label = _channel_label(channel)
+        handle = DISCUSSION_COST_GAUGE.labels(channel=channel_label)
+        if channel_label != OVERFLOW_LABEL:
+            _cost_handles[channel] = handle
+    return handle
+
+
+class _CostBatcher:
+    """Buffers cost observations and applies them to the histogram in periodic batches.
+
+    Inside a running event loop a background task drains the buffer every ``interval``
+    seconds; callers without a loop (worker threads) have their observation applied inline.
+    """
+
+    def __init__(self, interval: float = 1.0, max_pending: int = 1000) -> None:
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Deque[Tuple[str, float]] = deque()
+        self._flusher: Optional[asyncio.Task[None]] = None
+
+    def add(self, channel: str, cost: float) -> None:
+        self._pending.append((channel, cost))
+        if len(self._pending) >= self.max_pending:
+            self.drain()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.drain()
+            return
+        flusher = self._flusher
+        # A task left behind by a closed loop never finishes, so only a live one on this loop counts.
+        if flusher is not None and not flusher.done() and flusher.get_loop() is loop:
+            return
+        self._flusher = loop.create_task(self._flush_periodically())
+
+    def drain(self) -> None:
+        batches: Dict[str, List[float]] = {}
+        pending = self._pending
+        while True:
+            try:
+                channel, cost = pending.popleft()
+            except IndexError:
+                break
+            batches.setdefault(channel, []).append(cost)
+        for channel, costs in batches.items():
+            handle = _cost_handle(channel)
+            for cost in costs:
+                handle.observe(cost)
+
+    async def flush(self) -> None:
+        self.drain()
+
+    async def _flush_periodically(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            self.drain()
+
+
+_cost_batcher = _CostBatcher()
+
+
+def _observe_discussion_cost(channel: str, cost: float) -> None:
+    _cost_batcher.add(channel, cost)
+
+
+def _skip_observation(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+# Bound once at import so the hot path never re-checks whether prometheus_client is present.
+if Counter and Histogram:
+    observe_tool_usage: Callable[..., None] = _observe_tool_usage
+    observe_discussion_cost: Callable[..., None] = _observe_discussion_cost
+else:
+    logger.debug("Prometheus client not available; tool and cost metrics are disabled")
+    observe_tool_usage = _skip_observation
+    observe_discussion_cost = _skip_observation
 
 
-def observe_discussion_cost(channel: str, cost: float) -> None:
-    if not Counter or not Histogram:
-        logger.debug("Prometheus client not available; skipping cost metric")
-        return
-    DISCUSSION_COST_GAUGE.labels(channel=channel).observe(cost)
+async def flush_discussion_costs() -> None:
+    """Apply buffered cost observations now, e.g. before shutdown or in tests."""
+    if DISCUSSION_COST_GAUGE is not None:
+        await _cost_batcher.flush()
 
 
-__all__ = ["observe_tool_usage", "observe_discussion_cost", "TOOL_USAGE_COUNTER", "TOOL_LATENCY_HISTOGRAM", "DISCUSSION_COST_GAUGE"]
+__all__ = ["observe_tool_usage", "observe_discussion_cost", "flush_discussion_costs", "TOOL_USAGE_COUNTER", "TOOL_LATENCY_HISTOGRAM", "DISCUSSION_COST_GAUGE"]
@@ -1,6 +1,13 @@
 """Provider adapter registry."""
 from .anthropic_adapter import AnthropicAdapter
-from .base import ProviderAdapter, ProviderSettings, HTTPProviderAdapter, RateLimit
+from .base import (
+    HTTPProviderAdapter,
+    ProviderAdapter,
+    ProviderSettings,
+    RateLimit,
+    aclose_http_clients,
+    get_http_client,
+)
 from .deepseek_adapter import DeepSeekAdapter
 from .gemini_adapter import GeminiAdapter
 from .kimi_adapter import KimiAdapter
@@ -18,4 +25,6 @@ __all__ = [
     "DeepSeekAdapter",
     "GeminiAdapter",
     "KimiAdapter",
+    "aclose_http_clients",
+    "get_http_client",
 ]
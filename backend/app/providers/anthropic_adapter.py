@@ -28,13 +28,19 @@ class AnthropicAdapter(HTTPProviderAdapter):
         stream: bool = False,
         **options: Any,
     ) -> Dict[str, Any]:
+        compiled = prompt.compile(self.name, include_scratchpads=True)
         system = system_prompt
-        messages = []
-        for message in prompt.compile(self.name, include_scratchpads=True):
-            if message["role"] == "system" and system is None:
-                system = message["content"]
-                continue
-            messages.append({"role": message["role"], "content": message["content"]})
+        # Without an explicit system prompt, the first system message is lifted out of the list.
+        lifted = None
+        if system is None:
+            lifted = next((i for i, message in enumerate(compiled) if message["role"] == "system"), None)
+            if lifted is not None:
+                system = compiled[lifted]["content"]
+        messages = [
+            {"role": message["role"], "content": message["content"]}
+            for i, message in enumerate(compiled)
+            if i != lifted
+        ]
         payload: Dict[str, Any] = {
             "model": self.settings.model,
             "messages": messages,
@@ -46,7 +52,7 @@ class AnthropicAdapter(HTTPProviderAdapter):
         if temperature is not None:
             payload["temperature"] = temperature
         if tools:
-            payload["tools"] = [self.normalize_tool_spec(tool) for tool in tools]
-        payload.update(options)
-        payload["stream"] = stream and self.supports_streaming
-        return payload
+            payload["tools"] = self.normalize_tools(tools)
+        if options:
+            payload.update(options)
+        return self.apply_stream_flag(payload, stream)
@@ -4,14 +4,45 @@ from __future__ import annotations
 import abc
 import asyncio
 import hashlib
-import json
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Dict, Iterable, Optional
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:  # pragma: no cover - optional dependency
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    xxhash = None
+
+try:  # pragma: no cover - optional dependency
+    import h2  # type: ignore  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+
+from ..core import serialization
+from ..models.llm import Prompt
 
 logger = logging.getLogger(__name__)
 
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+WRITE_TIMEOUT = 10.0
+POOL_TIMEOUT = 5.0
+
+# Pooled clients live at module level, shared by every adapter that talks to the same endpoint
+# with the same timeout. httpx clients are tied to the event loop that first uses them, so the
+# running loop is part of the key.
+_http_clients: Dict[Tuple[Any, ...], Any] = {}
+
 
 @dataclass
 class RateLimit:
@@ -30,27 +61,37 @@ class AsyncTokenBucket:
 
     def __init__(self, limit: RateLimit) -> None:
         self.limit = limit
-        self.tokens = limit.burst or limit.rate_per_minute
+        self.tokens = float(limit.burst or limit.rate_per_minute)
         self.updated_at = time.monotonic()
         self.lock = asyncio.Lock()
+        self._waiters = asyncio.Condition(self.lock)
 
     async def acquire(self) -> None:
-        async with self.lock:
-            await self._refill()
-            while self.tokens <= 0:
-                wait_time = 60.0 / float(self.limit.rate_per_minute)
-                logger.debug("Rate limit reached. Sleeping for %.2f seconds.", wait_time)
-                await asyncio.sleep(wait_time)
-                await self._refill()
-            self.tokens -= 1
-
-    async def _refill(self) -> None:
+        async with self._waiters:
+            while True:
+                self._refill()
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                # Wait for exactly the missing fraction of a token. Condition.wait releases the
+                # lock meanwhile, and a refill observed by another caller wakes us early.
+                wait_time = (1.0 - self.tokens) * 60.0 / float(self.limit.rate_per_minute)
+                logger.debug("Rate limit reached. Waiting up to %.2f seconds.", wait_time)
+                try:
+                    await asyncio.wait_for(self._waiters.wait(), timeout=wait_time)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _refill(self) -> None:
+        """Accrue tokens for the elapsed time; callers must hold ``self.lock``."""
         now = time.monotonic()
         elapsed = now - self.updated_at
-        refill = int(elapsed * (self.limit.rate_per_minute / 60.0))
-        if refill > 0:
-            self.tokens = min(self.limit.burst or self.limit.rate_per_minute, self.tokens + refill)
-            self.updated_at = now
+        refill = elapsed * (self.limit.rate_per_minute / 60.0)
+        self.tokens = min(float(self.limit.burst or self.limit.rate_per_minute), self.tokens + refill)
+        self.updated_at = now
+        if self.tokens >= 2.0:
+            # More than this caller needs: let sleeping waiters take the rest now.
+            self._waiters.notify_all()
 
 
 @dataclass
@@ -80,6 +121,9 @@ class ProviderAdapter(abc.ABC):
     ) -> None:
         self.settings = settings
         self.rate_limiter = AsyncTokenBucket(rate_limit) if rate_limit else None
+        # Settings (including ``settings.headers``) are treated as immutable for the adapter's
+        # lifetime, so the request headers are merged once and the same dict is reused.
+        self._headers = {**self.build_auth_headers(settings), **settings.headers}
 
     async def execute(
         self,
@@ -89,16 +133,22 @@ class ProviderAdapter(abc.ABC):
     ) -> Any:
         if self.rate_limiter:
             await self.rate_limiter.acquire()
-        auth_headers = self.build_auth_headers(self.settings)
         request_payload = self.transform_payload(payload, stream=stream)
-        headers = {**auth_headers, **self.settings.headers}
-        logger.debug("Dispatching request to %s with payload keys: %s", self.name, list(request_payload.keys()))
-        return await self.dispatch(request_payload, headers=headers, stream=stream)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching request to %s with payload keys: %s", self.name, list(request_payload))
+        return await self.dispatch(request_payload, headers=self._headers, stream=stream)
 
     @abc.abstractmethod
     def create_payload(self, **kwargs: Any) -> Dict[str, Any]:
         """Convert normalized request arguments into a vendor payload."""
 
+    def create_simple_payload(self, prompt: Prompt) -> Dict[str, Any]:
+        """Payload for a bare prompt: no tools, options, response format or streaming.
+
+        Adapters whose generic builder does more than this override it with a direct build.
+        """
+        return self.create_payload(prompt=prompt)
+
     @abc.abstractmethod
     async def dispatch(
         self,
@@ -109,17 +159,33 @@ class ProviderAdapter(abc.ABC):
     ) -> Any:
         """Send a request to the vendor. Subclasses should implement this."""
 
+    def apply_stream_flag(self, payload: Dict[str, Any], stream: bool) -> Dict[str, Any]:
+        """Set ``stream`` only when streaming is in effect, overriding any value from options."""
+        if stream and self.supports_streaming:
+            payload["stream"] = True
+        else:
+            payload.pop("stream", None)
+        return payload
+
     def transform_payload(self, payload: Dict[str, Any], *, stream: bool = False) -> Dict[str, Any]:
-        """Apply vendor-specific payload transformations."""
-        transformed = dict(payload)
+        """Apply vendor-specific payload transformations.
+
+        The payload is updated in place: ``execute`` takes ownership of the dict it is given.
+        """
         if stream and self.supports_streaming:
-            transformed["stream"] = True
-        return transformed
+            payload["stream"] = True
+        return payload
 
     def build_auth_headers(self, settings: ProviderSettings) -> Dict[str, str]:
         """Return default authorization headers."""
         return {"Authorization": f"Bearer {settings.api_key}"}
 
+    def normalize_tools(self, tools: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalize every tool spec, skipping the per-tool call for passthrough adapters."""
+        if type(self).normalize_tool_spec is ProviderAdapter.normalize_tool_spec:
+            return list(tools)
+        return [self.normalize_tool_spec(tool) for tool in tools]
+
     def normalize_tool_spec(self, tool: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize tool schema for the provider."""
         if self.tool_call_format == "json":
@@ -129,8 +195,13 @@ class ProviderAdapter(abc.ABC):
 
     @staticmethod
     def cache_key(model: str, payload: Dict[str, Any]) -> str:
-        serialized = json.dumps({"model": model, "payload": payload}, sort_keys=True)
-        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        """Return ``"<model>:<digest>"`` so entries can be inspected or purged per model."""
+        serialized = serialization.dumps(payload, sort_keys=True)
+        if xxhash is not None:
+            digest = xxhash.xxh3_128_hexdigest(serialized)
+        else:
+            digest = hashlib.blake2b(serialized, digest_size=16).hexdigest()
+        return f"{model}:{digest}"
 
 
 class MockStreamingResponse:
@@ -150,6 +221,31 @@ class HTTPProviderAdapter(ProviderAdapter):
 
     timeout: Optional[float] = None
 
+    def __init__(
+        self,
+        settings: ProviderSettings,
+        rate_limit: Optional[RateLimit] = None,
+    ) -> None:
+        super().__init__(settings, rate_limit=rate_limit)
+        # Bodies are pre-encoded with the shared serializer, so httpx no longer sets this for us.
+        if not any(name.lower() == "content-type" for name in self._headers):
+            self._headers["Content-Type"] = "application/json"
+        self._timeout = self._build_timeout() if httpx is not None else None
+
+    def _build_timeout(self) -> Any:
+        """Separate phase timeouts: streamed completions need a long read, not a long connect.
+
+        ``settings.options["timeout"]`` may override any of connect/read/write/pool.
+        """
+        phases = {
+            "connect": CONNECT_TIMEOUT,
+            "read": self.settings.request_timeout or self.timeout or DEFAULT_READ_TIMEOUT,
+            "write": WRITE_TIMEOUT,
+            "pool": POOL_TIMEOUT,
+        }
+        phases.update(self.settings.options.get("timeout") or {})
+        return httpx.Timeout(**phases)
+
     async def dispatch(
         self,
         payload: Dict[str, Any],
@@ -157,18 +253,62 @@ class HTTPProviderAdapter(ProviderAdapter):
         headers: Dict[str, str],
         stream: bool = False,
     ) -> Any:
-        try:
-            import httpx  # type: ignore
-        except Exception as exc:  # pragma: no cover - optional dependency
+        if httpx is None:  # pragma: no cover - optional dependency
             raise RuntimeError(
                 "httpx is required to execute provider calls. Install httpx to continue."
-            ) from exc
+            )
+
+        client = get_http_client(self.settings.api_base, self._timeout)
+        if stream:
+            return self._dispatch_stream(client, payload, headers)
+        response = await client.post("/", headers=headers, content=serialization.dumps(payload))
+        response.raise_for_status()
+        return serialization.loads(response.content)
 
-        timeout = self.settings.request_timeout or self.timeout
-        async with httpx.AsyncClient(base_url=self.settings.api_base, timeout=timeout) as client:
-            request = client.stream if stream else client.post
-            response = await request("/", headers=headers, json=payload)
+    async def _dispatch_stream(
+        self,
+        client: Any,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+    ) -> AsyncGenerator[str, None]:
+        """Yield response text as it arrives; the response is closed when iteration ends."""
+        async with client.stream(
+            "POST", "/", headers=headers, content=serialization.dumps(payload)
+        ) as response:
             response.raise_for_status()
-            if stream and response.aiter_text:
-                return response.aiter_text()
-            return response.json()
+            async for chunk in response.aiter_text():
+                yield chunk
+
+
+def get_http_client(base_url: Optional[str], timeout: Any) -> Any:
+    """Return the running loop's pooled client for ``(base_url, timeout)``, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    key = (loop, base_url, timeout.connect, timeout.read, timeout.write, timeout.pool)
+    client = _http_clients.get(key)
+    if client is None or client.is_closed:
+        _discard_stale_clients()
+        client = httpx.AsyncClient(
+            base_url=base_url or "",
+            timeout=timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _http_clients[key] = client
+    return client
+
+
+def _discard_stale_clients() -> None:
+    """Forget clients whose event loop has closed; they can no longer be used or closed."""
+    for key in [key for key in _http_clients if key[0].is_closed()]:
+        del _http_clients[key]
+
+
+async def aclose_http_clients() -> None:
+    """Close the running loop's pooled clients; call from application shutdown."""
+    loop = asyncio.get_running_loop()
+    _discard_stale_clients()
+    for key in [key for key in _http_clients if key[0] is loop]:
+        await _http_clients.pop(key).aclose()
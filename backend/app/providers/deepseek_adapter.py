@@ -12,6 +12,9 @@ class DeepSeekAdapter(HTTPProviderAdapter):
     supports_logprobs = True
     tool_call_format = "json_schema"
 
+    def create_simple_payload(self, prompt: Prompt) -> Dict[str, Any]:
+        return {"model": self.settings.model, "messages": prompt.compile(self.name, include_scratchpads=True)}
+
     def create_payload(
         self,
         *,
@@ -30,11 +33,11 @@ class DeepSeekAdapter(HTTPProviderAdapter):
         if reasoning:
             payload["reasoning"] = reasoning
         if tools:
-            payload["tools"] = [self.normalize_tool_spec(tool) for tool in tools]
+            payload["tools"] = self.normalize_tools(tools)
         if max_tokens is not None:
             payload["max_output_tokens"] = max_tokens
         if temperature is not None:
             payload["temperature"] = temperature
-        payload.update(options)
-        payload["stream"] = stream and self.supports_streaming
-        return payload
+        if options:
+            payload.update(options)
+        return self.apply_stream_flag(payload, stream)
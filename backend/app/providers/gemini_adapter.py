@@ -26,20 +26,20 @@ class GeminiAdapter(HTTPProviderAdapter):
         stream: bool = False,
         **options: Any,
     ) -> Dict[str, Any]:
-        contents = []
-        for message in prompt.compile(self.name, include_scratchpads=True):
-            contents.append({
-                "role": message["role"],
-                "parts": [{"text": message["content"]}],
-            })
+        contents = [
+            {"role": message["role"], "parts": [{"text": message["content"]}]}
+            for message in prompt.compile(self.name, include_scratchpads=True)
+        ]
+        generation_config: Dict[str, Any] = {}
+        if max_tokens is not None:
+            generation_config["maxOutputTokens"] = max_tokens
+        if temperature is not None:
+            generation_config["temperature"] = temperature
         payload: Dict[str, Any] = {
             "contents": contents,
-            "generationConfig": {k: v for k, v in {
-                "maxOutputTokens": max_tokens,
-                "temperature": temperature,
-            }.items() if v is not None},
+            "generationConfig": generation_config,
             "tools": tools or [],
         }
-        payload.update(options)
-        payload["stream"] = stream and self.supports_streaming
-        return payload
+        if options:
+            payload.update(options)
+        return self.apply_stream_flag(payload, stream)
@@ -12,6 +12,9 @@ class KimiAdapter(HTTPProviderAdapter):
     supports_logprobs = False
     tool_call_format = "markdown"
 
+    def create_simple_payload(self, prompt: Prompt) -> Dict[str, Any]:
+        return {"model": self.settings.model, "messages": prompt.compile(self.name, include_scratchpads=True)}
+
     def create_payload(
         self,
         *,
@@ -31,7 +34,7 @@ class KimiAdapter(HTTPProviderAdapter):
         if temperature is not None:
             payload["temperature"] = temperature
         if tools:
-            payload["plugins"] = [self.normalize_tool_spec(tool) for tool in tools]
-        payload.update(options)
-        payload["stream"] = stream and self.supports_streaming
-        return payload
+            payload["plugins"] = self.normalize_tools(tools)
+        if options:
+            payload.update(options)
+        return self.apply_stream_flag(payload, stream)
@@ -12,6 +12,9 @@ class OpenAIAdapter(HTTPProviderAdapter):
     supports_logprobs = True
     tool_call_format = "json_schema"
 
+    def create_simple_payload(self, prompt: Prompt) -> Dict[str, Any]:
+        return {"model": self.settings.model, "messages": prompt.compile(self.name, include_scratchpads=True)}
+
     def create_payload(
         self,
         *,
@@ -32,10 +35,11 @@ class OpenAIAdapter(HTTPProviderAdapter):
         if temperature is not None:
             payload["temperature"] = temperature
         if tools:
-            payload["tools"] = [self.normalize_tool_spec(tool) for tool in tools]
+            payload["tools"] = self.normalize_tools(tools)
         if response_format:
             payload["response_format"] = response_format
-        payload.update(options)
+        if options:
+            payload.update(options)
         if stream:
             payload["stream_options"] = {"include_usage": True}
         return payload
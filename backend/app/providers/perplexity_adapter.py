@@ -29,11 +29,11 @@ class PerplexityAdapter(HTTPProviderAdapter):
             "return_citations": citations,
         }
         if tools:
-            payload["tools"] = [self.normalize_tool_spec(tool) for tool in tools]
+            payload["tools"] = self.normalize_tools(tools)
         if max_tokens is not None:
             payload["max_tokens"] = max_tokens
         if temperature is not None:
             payload["temperature"] = temperature
-        payload.update(options)
-        payload["stream"] = stream and self.supports_streaming
-        return payload
+        if options:
+            payload.update(options)
+        return self.apply_stream_flag(payload, stream)
@@ -10,14 +10,14 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
 from ..services.notifications import notify_consensus_reached, notify_manual_intervention
-from ..services.storage import ArtifactStorageService
+from ..services.storage import ArtifactStorageService, storage_service_for
 
 router = APIRouter(prefix="/artifacts", tags=["artifacts"])
 
 
 def get_storage_service() -> ArtifactStorageService:
   bucket = os.getenv("ARTIFACT_BUCKET", "artifacts")
-  return ArtifactStorageService(bucket=bucket)
+  return storage_service_for(bucket)
 
 
 @router.post("/export")
@@ -50,12 +50,12 @@ async def export_artifact(
     "exported_at": datetime.utcnow().isoformat() + "Z",
   }
 
-  storage.put_json_object(key=artifact_key, document=artifact_document)
+  await storage.aput_json_object(key=artifact_key, document=artifact_document)
 
   if consensus_state == "consensus":
-    notify_consensus_reached(topic_id=topic_id, artifact_key=artifact_key)
+    await notify_consensus_reached(topic_id=topic_id, artifact_key=artifact_key)
   elif consensus_state == "manual_review":
-    notify_manual_intervention(topic_id=topic_id, artifact_key=artifact_key)
+    await notify_manual_intervention(topic_id=topic_id, artifact_key=artifact_key)
 
   return {"artifact_key": artifact_key, "storage_bucket": storage.bucket}
 
@@ -118,7 +118,7 @@ async def ingest_agent_output(
 
   key = storage.build_agent_output_key(topic_id=topic_id, agent_id=agent_id)
 
-  storage.put_json_object(
+  await storage.aput_json_object(
     key=key,
     document={
       "topic_id": topic_id,
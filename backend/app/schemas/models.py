@@ -18,9 +18,11 @@ class DiscussionSessionRecord(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
-    turns = relationship("AgentTurnRecord", back_populates="session")
-    verdicts = relationship("JudgeVerdictRecord", back_populates="session")
-    events = relationship("EventRecord", back_populates="session")
+    turns = relationship("AgentTurnRecord", back_populates="session", order_by="AgentTurnRecord.created_at")
+    verdicts = relationship(
+        "JudgeVerdictRecord", back_populates="session", order_by="JudgeVerdictRecord.created_at"
+    )
+    events = relationship("EventRecord", back_populates="session", order_by="EventRecord.occurred_at")
 
 
 class AgentTurnRecord(Base):
@@ -36,7 +38,7 @@ class AgentTurnRecord(Base):
     completed_at = Column(DateTime)
 
     session = relationship("DiscussionSessionRecord", back_populates="turns")
-    tools = relationship("ToolResultRecord", back_populates="turn")
+    tools = relationship("ToolResultRecord", back_populates="turn", order_by="ToolResultRecord.created_at")
 
 
 class ToolResultRecord(Base):
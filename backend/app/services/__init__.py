@@ -1,10 +1,11 @@
 """Service helpers for the backend."""
 
 from .notifications import notify_consensus_reached, notify_manual_intervention
-from .storage import ArtifactStorageService
+from .storage import ArtifactStorageService, LocalArtifactStorageService
 
 __all__ = [
   "notify_consensus_reached",
   "notify_manual_intervention",
   "ArtifactStorageService",
+  "LocalArtifactStorageService",
 ]
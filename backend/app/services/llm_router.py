@@ -2,21 +2,28 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import math
+import time
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Dict, Optional, Tuple, Type
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Tuple, Type
 
 try:  # pragma: no cover - optional dependency
     import redis.asyncio as redis  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     redis = None
 
+try:  # pragma: no cover - optional dependency
+    import msgspec  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    msgspec = None
+
 try:  # pragma: no cover - optional dependency
     from opentelemetry import trace  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     trace = None
 
+from ..core import serialization
 from ..models.llm import LLMResponse, Prompt, ResponseChunk, ResponseUsage
 from ..providers import (
     AnthropicAdapter,
@@ -33,6 +40,37 @@ from .tools import ToolRegistry, default_registry
 
 logger = logging.getLogger(__name__)
 
+# Placeholder written by the request that owns a cache miss; concurrent requests for the same
+# key poll for the real value instead of calling the provider again.
+CACHE_PENDING = b"\x00pending"
+CACHE_RESERVATION_TTL = 60
+CACHE_WAIT_INTERVAL = 0.1
+CACHE_WAIT_ATTEMPTS = 50
+
+# Cache entries written with msgpack carry a one-byte format tag; untagged entries are JSON
+# (JSON text never starts with this byte), so both formats can share a cache during rollout.
+_MSGPACK_TAG = b"\x01"
+
+if msgspec is not None:
+    _msgpack_encoder = msgspec.msgpack.Encoder()
+    _msgpack_decoder = msgspec.msgpack.Decoder()
+
+
+def _encode_cache_value(value: Any) -> bytes:
+    if msgspec is not None:
+        return _MSGPACK_TAG + _msgpack_encoder.encode(value)
+    return serialization.dumps(value)
+
+
+def _decode_cache_value(data: bytes | str) -> Any:
+    if isinstance(data, str):
+        return serialization.loads(data)
+    if data[:1] == _MSGPACK_TAG:
+        if msgspec is None:
+            raise ValueError("msgpack cache entry found but msgspec is not installed")
+        return _msgpack_decoder.decode(memoryview(data)[1:])
+    return serialization.loads(data)
+
 
 @dataclass
 class ProviderConfig:
@@ -43,29 +81,46 @@ class ProviderConfig:
 
 
 class InMemoryCache:
-    """Fallback cache used when Redis is unavailable."""
+    """Fallback cache used when Redis is unavailable.
+
+    Reads and writes never await, so each runs atomically on the event loop and needs no lock.
+    """
 
     def __init__(self) -> None:
-        self._store: Dict[str, Any] = {}
-        self._lock = asyncio.Lock()
-
-    async def get(self, key: str) -> Optional[str]:
-        async with self._lock:
-            entry = self._store.get(key)
-            if not entry:
-                return None
-            value, expires_at = entry
-            if expires_at is not None and expires_at < asyncio.get_event_loop().time():
-                self._store.pop(key, None)
-                return None
-            return value
-
-    async def set(self, key: str, value: str, ex: Optional[int] = None) -> None:
-        async with self._lock:
-            expiry = None
-            if ex is not None:
-                expiry = asyncio.get_event_loop().time() + ex
-            self._store[key] = (value, expiry)
+        self._store: Dict[str, Tuple[bytes, float]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live_value(key)
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ex: Optional[int] = None,
+        nx: bool = False,
+        get: bool = False,
+    ) -> Any:
+        """Mirror redis ``SET``: ``nx`` only writes missing keys, ``get`` returns the old value."""
+        previous = self._live_value(key) if nx or get else None
+        written = not (nx and previous is not None)
+        if written:
+            self._store[key] = (value, math.inf if ex is None else time.monotonic() + ex)
+        if get:
+            return previous
+        return True if written else None
+
+    async def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+    def _live_value(self, key: str) -> Optional[bytes]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return value
 
 
 class LLMRouter:
@@ -91,6 +146,10 @@ class LLMRouter:
         self.default_cache_ttl = default_cache_ttl
         self._cache = self._init_cache(redis_url)
         self._provider_cache: Dict[str, ProviderConfig] = {}
+        # Provider name -> cache keys in registration order; the first one serves lookups by name.
+        self._keys_by_name: Dict[str, List[str]] = {}
+        self._adapter_cache: Dict[Tuple[str, str], ProviderAdapter] = {}
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
         self._tracer = trace.get_tracer(__name__) if trace else None
 
     def _init_cache(self, redis_url: Optional[str]) -> Any:
@@ -101,7 +160,14 @@ class LLMRouter:
     def register_provider(self, name: str, config: Dict[str, Any]) -> None:
         normalized = self.normalize_provider_config(name, config)
         key = normalized.settings.model or name
+        previous = self._provider_cache.get(key)
+        if previous is not None and previous.name != normalized.name:
+            self._keys_by_name[previous.name].remove(key)
+        if previous is None or previous.name != normalized.name:
+            self._keys_by_name.setdefault(normalized.name, []).append(key)
         self._provider_cache[key] = normalized
+        if previous is not None:
+            self._adapter_cache.pop((previous.name, previous.settings.model), None)
         logger.debug("Registered provider config for %s", key)
 
     def normalize_provider_config(self, name: str, config: Dict[str, Any]) -> ProviderConfig:
@@ -142,15 +208,20 @@ class LLMRouter:
         provider_name = provider.lower()
         if config is not None:
             normalized = self.normalize_provider_config(provider_name, config)
-        else:
-            normalized = next(
-                (value for key, value in self._provider_cache.items() if value.name == provider_name),
-                None,
-            )
-            if normalized is None:
-                raise ValueError(f"Provider {provider} is not registered and no config supplied")
-        adapter_cls = self.ADAPTERS[provider_name]
-        adapter = adapter_cls(normalized.settings, rate_limit=normalized.rate_limit)
+            adapter_cls = self.ADAPTERS[provider_name]
+            return adapter_cls(normalized.settings, rate_limit=normalized.rate_limit), normalized
+
+        keys = self._keys_by_name.get(provider_name)
+        if not keys:
+            raise ValueError(f"Provider {provider} is not registered and no config supplied")
+        normalized = self._provider_cache[keys[0]]
+        # Registered adapters are reused so their rate-limit buckets and headers persist across calls.
+        cache_key = (provider_name, normalized.settings.model)
+        adapter = self._adapter_cache.get(cache_key)
+        if adapter is None:
+            adapter_cls = self.ADAPTERS[provider_name]
+            adapter = adapter_cls(normalized.settings, rate_limit=normalized.rate_limit)
+            self._adapter_cache[cache_key] = adapter
         return adapter, normalized
 
     async def aroute(
@@ -168,29 +239,81 @@ class LLMRouter:
     ) -> Any:
         adapter, provider_config = self.get_adapter(provider, options.pop("provider_config", None))
         normalized_tools = self._normalize_tools(tools, session_id)
-        payload = adapter.create_payload(
-            prompt=prompt,
-            tools=normalized_tools,
-            stream=stream,
-            response_format=response_format,
-            **options,
-        )
+        if not normalized_tools and not stream and not response_format and not options:
+            payload = adapter.create_simple_payload(prompt)
+        else:
+            if response_format:
+                options["response_format"] = response_format
+            payload = adapter.create_payload(prompt=prompt, tools=normalized_tools, stream=stream, **options)
         cache_key = cache_key or ProviderAdapter.cache_key(adapter.settings.model, payload)
 
         if stream:
-            return await self._stream_response(adapter, payload)
-
-        cached = await self._fetch_cache(cache_key) if use_cache else None
+            return self._stream_response(adapter, payload)
+
+        if not use_cache:
+            return await self._call_provider(adapter, provider_config, provider, payload, cache_key)
+
+        # Single-flight: concurrent identical requests in this process share one lookup/call.
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None:
+            logger.debug("Joining in-flight request for %s", cache_key)
+            return self._coerce_response(provider, await asyncio.shield(in_flight))
+        in_flight = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = in_flight
+        try:
+            response = await self._route_cached(adapter, provider_config, provider, payload, cache_key)
+        except BaseException as exc:
+            in_flight.set_exception(
+                exc if isinstance(exc, Exception) else RuntimeError("Coalesced LLM request was cancelled")
+            )
+            in_flight.exception()  # mark retrieved so a failure nobody joined is not logged
+            raise
+        finally:
+            self._in_flight.pop(cache_key, None)
+        in_flight.set_result(response.raw)
+        return response
+
+    async def _route_cached(
+        self,
+        adapter: ProviderAdapter,
+        provider_config: ProviderConfig,
+        provider: str,
+        payload: Dict[str, Any],
+        cache_key: str,
+    ) -> LLMResponse:
+        cached, reserved = await self._reserve_cache(cache_key)
         if cached:
-            logger.debug("Cache hit for %s", cache_key)
-            raw_response = json.loads(cached)
-            return self._coerce_response(provider, raw_response)
+            try:
+                raw_response = _decode_cache_value(cached)
+            except Exception:
+                logger.debug("Ignoring unreadable cache entry %s", cache_key, exc_info=True)
+            else:
+                logger.debug("Cache hit for %s", cache_key)
+                return self._coerce_response(provider, raw_response)
+        try:
+            return await self._call_provider(
+                adapter, provider_config, provider, payload, cache_key, store=True
+            )
+        except BaseException:
+            if reserved:
+                await self._release_cache(cache_key)
+            raise
 
+    async def _call_provider(
+        self,
+        adapter: ProviderAdapter,
+        provider_config: ProviderConfig,
+        provider: str,
+        payload: Dict[str, Any],
+        cache_key: str,
+        *,
+        store: bool = False,
+    ) -> LLMResponse:
         span_ctx = self._tracer.start_as_current_span("llm.call") if self._tracer else nullcontext()
         async with span_ctx as span:
             raw_response = await adapter.execute(payload, stream=False)
             response = self._coerce_response(provider, raw_response)
-            if use_cache:
+            if store:
                 await self._store_cache(provider_config, cache_key, raw_response)
             if span:
                 self._enrich_span(span, provider, payload, response)
@@ -199,30 +322,22 @@ class LLMRouter:
     def _normalize_tools(self, tools: Optional[Any], session_id: Optional[str]) -> Optional[Any]:
         if not tools:
             return None
-        session_identifier = session_id or "anonymous"
         normalized = []
+        charged = []
         for tool in tools:
             if isinstance(tool, str):
                 definition = self.tool_registry.get(tool)
-                self.tool_registry.ensure_budget(name=definition.name, session_id=session_identifier)
-                normalized.append(
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": definition.name,
-                            "description": definition.description,
-                            "parameters": definition.json_schema,
-                        },
-                        "metadata": definition.metadata,
-                    }
-                )
+                charged.append(definition.name)
+                normalized.append(definition.openai_function_schema)
             elif isinstance(tool, dict):
                 tool_name = tool.get("name") or tool.get("function", {}).get("name")
                 if tool_name:
-                    self.tool_registry.ensure_budget(name=tool_name, session_id=session_identifier)
+                    charged.append(tool_name)
                 normalized.append(tool)
             else:
                 normalized.append(tool)
+        if charged:
+            self.tool_registry.ensure_budget_many(session_id=session_id or "anonymous", names=charged)
         return normalized
 
     async def _stream_response(
@@ -233,10 +348,42 @@ class LLMRouter:
         stream = await adapter.execute(payload, stream=True)
         index = 0
         async for chunk in stream:
-            yield ResponseChunk(index=index, content=chunk if isinstance(chunk, str) else json.dumps(chunk))
+            content = chunk if isinstance(chunk, str) else serialization.dumps(chunk).decode("utf-8")
+            yield ResponseChunk(index=index, content=content)
             index += 1
 
-    async def _fetch_cache(self, key: str) -> Optional[str]:
+    async def _reserve_cache(self, key: str) -> Tuple[Optional[bytes], bool]:
+        """Read ``key`` or atomically claim it with ``SET NX GET``.
+
+        Returns the cached value (if any) and whether this caller now owns the slot and must
+        fill or release it. Callers that find another request's claim wait briefly for its
+        result instead of issuing the same provider call.
+        """
+        try:
+            previous = await self._cache.set(
+                key, CACHE_PENDING, ex=CACHE_RESERVATION_TTL, nx=True, get=True
+            )
+        except Exception:  # pragma: no cover - network errors ignored
+            logger.warning("Failed to reserve cache key %s", key, exc_info=True)
+            return None, False
+        if previous is None:
+            return None, True
+        if previous != CACHE_PENDING:
+            return previous, False
+        for _ in range(CACHE_WAIT_ATTEMPTS):
+            await asyncio.sleep(CACHE_WAIT_INTERVAL)
+            value = await self._fetch_cache(key)
+            if value != CACHE_PENDING:
+                return value, False
+        return None, False
+
+    async def _release_cache(self, key: str) -> None:
+        try:
+            await self._cache.delete(key)
+        except Exception:  # pragma: no cover - network errors ignored
+            logger.warning("Failed to release cache key %s", key, exc_info=True)
+
+    async def _fetch_cache(self, key: str) -> Optional[bytes]:
         if isinstance(self._cache, InMemoryCache):
             return await self._cache.get(key)
         try:
@@ -247,7 +394,7 @@ class LLMRouter:
 
     async def _store_cache(self, provider_config: ProviderConfig, key: str, value: Any) -> None:
         ttl = provider_config.cache_ttl or self.default_cache_ttl
-        serialized = json.dumps(value)
+        serialized = _encode_cache_value(value)
         if isinstance(self._cache, InMemoryCache):
             await self._cache.set(key, serialized, ex=ttl)
         else:
@@ -257,11 +404,9 @@ class LLMRouter:
                 logger.warning("Failed to store cache key %s", key, exc_info=True)
 
     def _coerce_response(self, provider: str, raw: Any) -> LLMResponse:
-        text = ""
         usage = None
         logprobs = None
-        tool_calls = []
-        frames = []
+        tool_calls: List[Dict[str, Any]] = []
 
         if isinstance(raw, dict):
             usage_data = raw.get("usage")
@@ -271,38 +416,15 @@ class LLMRouter:
                     output_tokens=usage_data.get("completion_tokens", usage_data.get("output_tokens", 0)),
                     cost=usage_data.get("total_cost"),
                 )
-            if provider == "openai":
-                choices = raw.get("choices", [])
-                if choices:
-                    message = choices[0].get("message", {})
-                    text = message.get("content", "")
-                    logprobs = message.get("logprobs")
-                    tool_calls = message.get("tool_calls", [])
-            elif provider == "anthropic":
-                content = raw.get("content", [])
-                if content:
-                    text = "".join(part.get("text", "") for part in content)
-            elif provider == "perplexity":
-                text = raw.get("output", "") or raw.get("answer", "")
-            elif provider == "deepseek":
-                choices = raw.get("choices", [])
-                if choices:
-                    text = choices[0].get("message", {}).get("content", "")
-                    logprobs = choices[0].get("logprobs")
-            elif provider == "gemini":
-                candidates = raw.get("candidates", [])
-                if candidates:
-                    parts = candidates[0].get("content", {}).get("parts", [])
-                    text = "".join(part.get("text", "") for part in parts)
-            elif provider == "kimi":
-                choices = raw.get("choices", [])
-                if choices:
-                    text = choices[0].get("message", {}).get("content", "")
+            extractor = _PROVIDER_EXTRACTORS.get(provider)
+            text = ""
+            if extractor is not None:
+                text, tool_calls, logprobs = extractor(raw)
             text = text or raw.get("text", "")
         else:
             text = str(raw)
 
-        return LLMResponse(text=text, raw=raw, usage=usage, logprobs=logprobs, frames=frames, tool_calls=tool_calls)
+        return LLMResponse(text=text, raw=raw, usage=usage, logprobs=logprobs, frames=[], tool_calls=tool_calls)
 
     def _enrich_span(self, span: Any, provider: str, payload: Dict[str, Any], response: LLMResponse) -> None:
         try:
@@ -315,6 +437,49 @@ class LLMRouter:
             logger.debug("Failed to annotate trace span", exc_info=True)
 
 
+_Extraction = Tuple[str, List[Dict[str, Any]], Any]
+
+
+def _extract_chat_completion(raw: Dict[str, Any]) -> _Extraction:
+    """OpenAI-compatible ``choices[0].message`` responses (OpenAI, DeepSeek, Kimi)."""
+    choices = raw.get("choices")
+    if not choices:
+        return "", [], None
+    choice = choices[0]
+    message = choice.get("message") or {}
+    logprobs = message.get("logprobs")
+    if logprobs is None:
+        logprobs = choice.get("logprobs")
+    return message.get("content", ""), message.get("tool_calls") or [], logprobs
+
+
+def _extract_anthropic(raw: Dict[str, Any]) -> _Extraction:
+    content = raw.get("content", [])
+    return "".join(part.get("text", "") for part in content), [], None
+
+
+def _extract_perplexity(raw: Dict[str, Any]) -> _Extraction:
+    return raw.get("output", "") or raw.get("answer", ""), [], None
+
+
+def _extract_gemini(raw: Dict[str, Any]) -> _Extraction:
+    candidates = raw.get("candidates")
+    if not candidates:
+        return "", [], None
+    parts = candidates[0].get("content", {}).get("parts", [])
+    return "".join(part.get("text", "") for part in parts), [], None
+
+
+_PROVIDER_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], _Extraction]] = {
+    "openai": _extract_chat_completion,
+    "deepseek": _extract_chat_completion,
+    "kimi": _extract_chat_completion,
+    "anthropic": _extract_anthropic,
+    "perplexity": _extract_perplexity,
+    "gemini": _extract_gemini,
+}
+
+
 class nullcontext:
     """Fallback async context manager for when OpenTelemetry is unavailable."""
 
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Awaitable, Dict, List, Optional
 
 import httpx
 
+from ..providers.base import get_http_client
+
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_TIMEOUT = httpx.Timeout(5.0)
+
 
 @dataclass
 class NotificationConfig:
@@ -26,19 +31,27 @@ class NotificationConfig:
     )
 
 
-def _post_json(url: str, payload: Dict[str, object], api_key: Optional[str] = None) -> None:
-  headers = {"Content-Type": "application/json"}
-  if api_key:
-    headers["Authorization"] = f"Bearer {api_key}"
-
+async def _post_json(url: str, payload: Dict[str, object], api_key: Optional[str] = None) -> None:
+  # Webhook URLs are third-party endpoints, so the API key is never sent as a bearer token.
   try:
-    response = httpx.post(url, json=payload, timeout=5)
+    client = get_http_client(None, NOTIFICATION_TIMEOUT)
+    response = await client.post(url, json=payload)
     response.raise_for_status()
   except httpx.HTTPError as error:
     logger.warning("Notification delivery failed: %s", error)
 
 
-def notify_consensus_reached(topic_id: str, artifact_key: str) -> None:
+async def _deliver(deliveries: List[Awaitable[None]]) -> None:
+  if not deliveries:
+    return
+  # HTTP failures are logged in _post_json; anything else still surfaces to the caller once
+  # every delivery has been attempted.
+  for result in await asyncio.gather(*deliveries, return_exceptions=True):
+    if isinstance(result, BaseException):
+      raise result
+
+
+async def notify_consensus_reached(topic_id: str, artifact_key: str) -> None:
   config = NotificationConfig.from_env()
   message = {
     "topic_id": topic_id,
@@ -46,25 +59,28 @@ def notify_consensus_reached(topic_id: str, artifact_key: str) -> None:
     "event": "consensus_reached",
   }
 
+  deliveries: List[Awaitable[None]] = []
   if config.slack_webhook_url:
-    _post_json(
+    deliveries.append(_post_json(
       url=config.slack_webhook_url,
       payload={"text": f"Consensus reached for {topic_id}: {artifact_key}"},
       api_key=config.api_key,
-    )
+    ))
 
   if config.email_endpoint:
-    _post_json(
+    deliveries.append(_post_json(
       url=config.email_endpoint,
       payload={
         "subject": f"Consensus reached for {topic_id}",
         "body": json.dumps(message, indent=2),
       },
       api_key=config.api_key,
-    )
+    ))
+
+  await _deliver(deliveries)
 
 
-def notify_manual_intervention(topic_id: str, artifact_key: str) -> None:
+async def notify_manual_intervention(topic_id: str, artifact_key: str) -> None:
   config = NotificationConfig.from_env()
 
   message = {
@@ -73,21 +89,24 @@ def notify_manual_intervention(topic_id: str, artifact_key: str) -> None:
     "event": "manual_intervention_requested",
   }
 
+  deliveries: List[Awaitable[None]] = []
   if config.slack_webhook_url:
-    _post_json(
+    deliveries.append(_post_json(
       url=config.slack_webhook_url,
       payload={
         "text": f"Manual review requested for {topic_id}. Artifact: {artifact_key}",
       },
       api_key=config.api_key,
-    )
+    ))
 
   if config.email_endpoint:
-    _post_json(
+    deliveries.append(_post_json(
       url=config.email_endpoint,
       payload={
         "subject": f"Manual review needed for {topic_id}",
         "body": json.dumps(message, indent=2),
       },
       api_key=config.api_key,
-    )
+    ))
+
+  await _deliver(deliveries)
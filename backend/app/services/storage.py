@@ -1,36 +1,77 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import os
 from dataclasses import dataclass
-from typing import Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+from urllib.parse import urlparse
 
 import boto3
 
+from ..core import serialization
+
+
+def _short_digest(value: str) -> str:
+  """First 8 hex chars of SHA-256, hex-encoding only the 4 bytes that are kept."""
+  return hashlib.sha256(value.encode("utf-8")).digest()[:4].hex()
+
+
+@lru_cache(maxsize=1)
+def _s3_client() -> Any:
+  """Build the process-wide S3 client once; boto3 clients are thread-safe."""
+  return boto3.client(
+    "s3",
+    endpoint_url=os.getenv("STORAGE_ENDPOINT_URL"),
+    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+    region_name=os.getenv("AWS_REGION", "us-east-1"),
+  )
+
 
 @dataclass
 class ArtifactStorageService:
   bucket: str
 
-  def _client(self):
-    endpoint_url = os.getenv("STORAGE_ENDPOINT_URL")
-    return boto3.client(
-      "s3",
-      endpoint_url=endpoint_url,
-      aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-      aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-      region_name=os.getenv("AWS_REGION", "us-east-1"),
-    )
+  def _client(self) -> Any:
+    return _s3_client()
 
   def build_artifact_key(self, *, topic_id: str, title: str, storage_prefix: str) -> str:
     safe_title = "-".join(title.lower().split())
-    digest = hashlib.sha256(title.encode("utf-8")).hexdigest()[:8]
-    return f"{storage_prefix.rstrip('/')}/{topic_id}/{safe_title}-{digest}.json"
+    return f"{storage_prefix.rstrip('/')}/{topic_id}/{safe_title}-{_short_digest(title)}.json"
 
   def build_agent_output_key(self, *, topic_id: str, agent_id: str) -> str:
-    return f"agent-outputs/{topic_id}/{agent_id}-{hashlib.sha256(agent_id.encode('utf-8')).hexdigest()[:8]}.json"
+    return f"agent-outputs/{topic_id}/{agent_id}-{_short_digest(agent_id)}.json"
 
   def put_json_object(self, *, key: str, document: Dict[str, object]) -> None:
-    body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    body = serialization.dumps(document)
     self._client().put_object(Bucket=self.bucket, Key=key, Body=body, ContentType="application/json")
+
+  async def aput_json_object(self, *, key: str, document: Dict[str, object]) -> None:
+    """Run :meth:`put_json_object` on a worker thread so the event loop keeps serving."""
+    await asyncio.to_thread(self.put_json_object, key=key, document=document)
+
+
+@dataclass
+class LocalArtifactStorageService(ArtifactStorageService):
+  """Spool artifacts to a local directory (``STORAGE_ENDPOINT_URL=file:///path``)."""
+
+  root: Path = Path(".")
+
+  def put_json_object(self, *, key: str, document: Dict[str, object]) -> None:
+    base = (self.root / self.bucket).resolve()
+    path = (base / key).resolve()
+    if not path.is_relative_to(base):
+      raise ValueError(f"Artifact key escapes the storage root: {key}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(serialization.dumps(document))
+
+
+def storage_service_for(bucket: str) -> ArtifactStorageService:
+  """Pick the storage backend from ``STORAGE_ENDPOINT_URL``: ``file://`` spools locally, else S3."""
+  endpoint = urlparse(os.getenv("STORAGE_ENDPOINT_URL") or "")
+  if endpoint.scheme == "file":
+    return LocalArtifactStorageService(bucket=bucket, root=Path(endpoint.path))
+  return ArtifactStorageService(bucket=bucket)
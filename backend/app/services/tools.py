@@ -1,7 +1,9 @@
 """Registry of function calling tools available to the LLM router."""
 from __future__ import annotations
 
+from contextlib import ExitStack
 from dataclasses import dataclass, field
+from functools import cached_property
 from threading import Lock
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -16,6 +18,30 @@ class ToolDefinition:
     per_session_budget: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @cached_property
+    def openai_function_schema(self) -> Dict[str, Any]:
+        """OpenAI-style function tool entry, built once and shared across requests."""
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.json_schema,
+            },
+            "metadata": self.metadata,
+        }
+
+
+MICRO_UNITS = 1_000_000
+
+
+def _to_micro(value: float) -> int:
+    return round(value * MICRO_UNITS)
+
+
+def _limit_to_micro(value: Optional[float]) -> Optional[int]:
+    return None if value is None else _to_micro(value)
+
 
 class ToolBudgetExceeded(Exception):
     """Raised when invoking a tool would exceed the configured budget."""
@@ -26,14 +52,25 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._definitions: Dict[str, ToolDefinition] = {}
-        self._global_consumption: Dict[str, float] = {}
-        self._session_consumption: Dict[Tuple[str, str], float] = {}
+        # Consumption is tracked in integer micro-units so tallies never accumulate float error.
+        self._global_consumption: Dict[str, int] = {}
+        self._session_consumption: Dict[Tuple[str, str], int] = {}
+        self._budgets: Dict[str, Tuple[int, Optional[int], Optional[int]]] = {}
         self._lock = Lock()
+        # Budget accounting is sharded per tool so unrelated tools never contend.
+        self._locks: Dict[str, Lock] = {}
 
     def register(self, definition: ToolDefinition) -> None:
         with self._lock:
+            self._locks.setdefault(definition.name, Lock())
             self._definitions[definition.name] = definition
-            self._global_consumption.setdefault(definition.name, 0.0)
+            definition.openai_function_schema  # noqa: B018 - warm the cached schema off the request path
+            self._budgets[definition.name] = (
+                _to_micro(definition.cost_per_call),
+                _limit_to_micro(definition.global_budget),
+                _limit_to_micro(definition.per_session_budget),
+            )
+            self._global_consumption.setdefault(definition.name, 0)
 
     def get(self, name: str) -> ToolDefinition:
         try:
@@ -45,37 +82,61 @@ class ToolRegistry:
         return list(self._definitions.values())
 
     def ensure_budget(self, *, name: str, session_id: str, cost: Optional[float] = None) -> None:
-        definition = self.get(name)
-        computed_cost = cost if cost is not None else definition.cost_per_call
-        key = (name, session_id)
-        with self._lock:
-            total = self._global_consumption.get(name, 0.0) + computed_cost
-            if definition.global_budget is not None and total > definition.global_budget:
-                raise ToolBudgetExceeded(
-                    f"Global budget exceeded for {name}: {total:.2f} > {definition.global_budget:.2f}"
-                )
-            session_total = self._session_consumption.get(key, 0.0) + computed_cost
-            if definition.per_session_budget is not None and session_total > definition.per_session_budget:
-                raise ToolBudgetExceeded(
-                    f"Session budget exceeded for {name}: {session_total:.2f} > {definition.per_session_budget:.2f}"
-                )
-            self._global_consumption[name] = total
-            self._session_consumption[key] = session_total
-
-    def remaining_budget(self, *, name: str, session_id: str) -> Dict[str, Optional[float]]:
-        definition = self.get(name)
-        with self._lock:
-            global_remaining = (
-                None
-                if definition.global_budget is None
-                else max(definition.global_budget - self._global_consumption.get(name, 0.0), 0.0)
+        self.get(name)
+        cost_micro = self._budgets[name][0] if cost is None else _to_micro(cost)
+        with self._locks[name]:
+            totals = self._check_budget(name, session_id, cost_micro)
+            self._global_consumption[name], self._session_consumption[(name, session_id)] = totals
+
+    def ensure_budget_many(self, *, session_id: str, names: Iterable[str]) -> None:
+        """Charge one call of each named tool, all-or-nothing, under a single critical section."""
+        charges: Dict[str, int] = {}
+        for name in names:
+            self.get(name)
+            charges[name] = charges.get(name, 0) + self._budgets[name][0]
+        if not charges:
+            return
+        # Sorted acquisition keeps concurrent batches from deadlocking on overlapping tools.
+        ordered = sorted(charges)
+        with ExitStack() as stack:
+            for name in ordered:
+                stack.enter_context(self._locks[name])
+            totals = [self._check_budget(name, session_id, charges[name]) for name in ordered]
+            for name, (total, session_total) in zip(ordered, totals):
+                self._global_consumption[name] = total
+                self._session_consumption[(name, session_id)] = session_total
+
+    def _check_budget(self, name: str, session_id: str, cost_micro: int) -> Tuple[int, int]:
+        """Return the new ``(global, session)`` tallies; caller must hold the tool's lock."""
+        _, global_budget, session_budget = self._budgets[name]
+        total = self._global_consumption.get(name, 0) + cost_micro
+        if global_budget is not None and total > global_budget:
+            raise ToolBudgetExceeded(
+                f"Global budget exceeded for {name}: "
+                f"{total / MICRO_UNITS:.2f} > {global_budget / MICRO_UNITS:.2f}"
             )
-            session_key = (name, session_id)
-            session_remaining = (
-                None
-                if definition.per_session_budget is None
-                else max(definition.per_session_budget - self._session_consumption.get(session_key, 0.0), 0.0)
+        session_total = self._session_consumption.get((name, session_id), 0) + cost_micro
+        if session_budget is not None and session_total > session_budget:
+            raise ToolBudgetExceeded(
+                f"Session budget exceeded for {name}: "
+                f"{session_total / MICRO_UNITS:.2f} > {session_budget / MICRO_UNITS:.2f}"
             )
+        return total, session_total
+
+    def remaining_budget(self, *, name: str, session_id: str) -> Dict[str, Optional[float]]:
+        self.get(name)
+        _, global_budget, session_budget = self._budgets[name]
+        # Single dict reads are atomic, so reporting needs no lock.
+        global_remaining = (
+            None
+            if global_budget is None
+            else max(global_budget - self._global_consumption.get(name, 0), 0) / MICRO_UNITS
+        )
+        session_remaining = (
+            None
+            if session_budget is None
+            else max(session_budget - self._session_consumption.get((name, session_id), 0), 0) / MICRO_UNITS
+        )
         return {"global": global_remaining, "session": session_remaining}
 
 
@@ -3,7 +3,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Iterable, List, Mapping, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
 
 from backend.app.tools.finance.adapters import BaseAdapter, NormalizedQuote
 
@@ -13,17 +18,23 @@ logger = logging.getLogger(__name__)
 def verify_numeric_consistency(reported: float, actual: float, tolerance: float = 0.01) -> bool:
     """Return True when the reported value is within the tolerance of the actual value."""
     if actual == 0:
-        result = abs(reported) <= tolerance
-    else:
-        result = abs(reported - actual) / abs(actual) <= tolerance
-    logger.debug(
-        "verify_numeric_consistency reported=%s actual=%s tolerance=%s result=%s",
-        reported,
-        actual,
-        tolerance,
-        result,
+        return abs(reported) <= tolerance
+    return abs(reported - actual) / abs(actual) <= tolerance
+
+
+def _verify_batch(reported: Sequence[float], actual: Sequence[float], tolerance: float) -> List[bool]:
+    """Vectorised :func:`verify_numeric_consistency` over paired values."""
+    if np is None:
+        return [verify_numeric_consistency(r, a, tolerance) for r, a in zip(reported, actual)]
+    reported_arr = np.asarray(reported, dtype=np.float64)
+    actual_arr = np.asarray(actual, dtype=np.float64)
+    zero = actual_arr == 0
+    errors = np.where(
+        zero,
+        np.abs(reported_arr),
+        np.abs(reported_arr - actual_arr) / np.where(zero, 1.0, np.abs(actual_arr)),
     )
-    return result
+    return (errors <= tolerance).tolist()
 
 
 @dataclass
@@ -41,16 +52,18 @@ def validate_series_against_reference(
     if len(reported_series) != len(reference_series):
         raise ValueError("Series must be the same length to validate consistency")
 
-    mismatched_indices = []
-    relative_errors = []
-    for idx, (reported, actual) in enumerate(zip(reported_series, reference_series)):
-        if actual == 0:
-            error = abs(reported)
-        else:
-            error = abs(reported - actual) / abs(actual)
-        if error > tolerance:
-            mismatched_indices.append(idx)
-            relative_errors.append(error)
+    if np is None:
+        mismatched_indices, relative_errors = _series_mismatches_py(
+            reported_series, reference_series, tolerance
+        )
+    else:
+        reported = np.asarray(reported_series, dtype=np.float64)
+        actual = np.asarray(reference_series, dtype=np.float64)
+        zero = actual == 0
+        errors = np.where(zero, np.abs(reported), np.abs(reported - actual) / np.where(zero, 1.0, np.abs(actual)))
+        bad = errors > tolerance
+        mismatched_indices = np.flatnonzero(bad).tolist()
+        relative_errors = errors[bad].tolist()
     result = SeriesValidationResult(
         is_consistent=not mismatched_indices,
         mismatched_indices=mismatched_indices,
@@ -64,6 +77,24 @@ def validate_series_against_reference(
     return result
 
 
+def _series_mismatches_py(
+    reported_series: Sequence[float],
+    reference_series: Sequence[float],
+    tolerance: float,
+) -> Tuple[List[int], List[float]]:
+    mismatched_indices = []
+    relative_errors = []
+    for idx, (reported, actual) in enumerate(zip(reported_series, reference_series)):
+        if actual == 0:
+            error = abs(reported)
+        else:
+            error = abs(reported - actual) / abs(actual)
+        if error > tolerance:
+            mismatched_indices.append(idx)
+            relative_errors.append(error)
+    return mismatched_indices, relative_errors
+
+
 def cross_check_with_adapter(
     adapter: BaseAdapter,
     symbol: str,
@@ -72,11 +103,16 @@ def cross_check_with_adapter(
     tolerance: float = 0.015,
 ) -> Mapping[str, Any]:
     quote: NormalizedQuote = adapter.fetch(symbol)
+    fields = tuple(fields)
+    reported_values = [float(reported.get(field, 0.0)) for field in fields]
+    actual_values = [getattr(quote, field) for field in fields]
     discrepancies = {}
-    for field in fields:
-        reported_value = float(reported.get(field, 0.0))
-        actual_value = getattr(quote, field)
-        is_valid = verify_numeric_consistency(reported_value, actual_value, tolerance=tolerance)
+    for field, reported_value, actual_value, is_valid in zip(
+        fields,
+        reported_values,
+        actual_values,
+        _verify_batch(reported_values, actual_values, tolerance),
+    ):
         if not is_valid:
             discrepancies[field] = {
                 "reported": reported_value,
@@ -1,10 +1,16 @@
 """Finance data adapters with caching and normalization support."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections import OrderedDict
+from hashlib import blake2b
+from operator import itemgetter
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Protocol
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol, Sequence
+
+from ...core.interning import intern_identifier
 
 logger = logging.getLogger(__name__)
 
@@ -20,30 +26,41 @@ class CacheBackend(Protocol):
 
 
 class InMemoryTTLCache:
-    """Simple in-memory TTL cache suitable for tests and small deployments."""
+    """Simple in-memory TTL cache with LRU eviction, suitable for tests and small deployments."""
+
+    __slots__ = ("default_ttl", "maxsize", "_store")
 
-    def __init__(self, default_ttl: float = 60.0) -> None:
+    def __init__(self, default_ttl: float = 60.0, maxsize: int = 1024) -> None:
         self.default_ttl = default_ttl
-        self._store: MutableMapping[str, tuple[float, Any]] = {}
+        self.maxsize = maxsize
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
 
     def get(self, key: str) -> Optional[Any]:
-        record = self._store.get(key)
-        if not record:
+        store = self._store
+        record = store.get(key)
+        if record is None:
             return None
         expiry, value = record
         if time.monotonic() > expiry:
-            logger.debug("Cache expired for key=%s", key)
-            self._store.pop(key, None)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cache expired for key=%s", key)
+            del store[key]
             return None
+        store.move_to_end(key)
         return value
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        store = self._store
         expiry = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
-        self._store[key] = (expiry, value)
-        logger.debug("Cache set for key=%s (ttl=%s)", key, ttl or self.default_ttl)
+        store[key] = (expiry, value)
+        store.move_to_end(key)
+        while len(store) > self.maxsize:
+            store.popitem(last=False)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache set for key=%s (ttl=%s)", key, ttl or self.default_ttl)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedQuote:
     symbol: str
     timestamp: float
@@ -74,13 +91,18 @@ class BaseAdapter:
         self.client = client
         self.cache = cache or InMemoryTTLCache(default_ttl=cache_ttl)
         self.cache_ttl = cache_ttl
+        self._key_prefix = f"{type(self).__name__}:"
 
     def _cache_key(self, symbol: str, **kwargs: Any) -> str:
-        suffix = "|".join(f"{key}={value}" for key, value in sorted(kwargs.items()))
-        return f"{self.__class__.__name__}:{symbol}:{suffix}"
+        if not kwargs:
+            return self._key_prefix + symbol + ":"
+        # Arguments are digested so large values (e.g. raw query blobs) don't bloat keys.
+        digest = blake2b(repr(sorted(kwargs.items())).encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self._key_prefix}{symbol}:{digest}"
 
     def _fetch_from_client(self, symbol: str, **kwargs: Any) -> Mapping[str, Any]:
-        logger.debug("Fetching %s data for %s with kwargs=%s", self.__class__.__name__, symbol, kwargs)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching %s data for %s with kwargs=%s", self.__class__.__name__, symbol, kwargs)
         return self.client(symbol=symbol, **kwargs)
 
     def _normalize(self, symbol: str, payload: Mapping[str, Any]) -> NormalizedQuote:
@@ -90,7 +112,8 @@ class BaseAdapter:
         cache_key = self._cache_key(symbol, **kwargs)
         cached = self.cache.get(cache_key)
         if cached is not None:
-            logger.debug("Cache hit for %s", cache_key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cache hit for %s", cache_key)
             return cached
 
         raw = self._fetch_from_client(symbol, **kwargs)
@@ -99,6 +122,32 @@ class BaseAdapter:
         logger.info("Fetched %s data for %s", self.__class__.__name__, symbol)
         return normalized
 
+    async def fetch_many(self, symbols: Sequence[str], **kwargs: Any) -> List[NormalizedQuote]:
+        """Fetch several symbols, issuing the client calls for cache misses concurrently.
+
+        Results follow the order of ``symbols``. The client is synchronous, so each miss runs
+        on a worker thread.
+        """
+        quotes: Dict[str, NormalizedQuote] = {}
+        misses: List[str] = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self.cache.get(self._cache_key(symbol, **kwargs))
+            if cached is not None:
+                quotes[symbol] = cached
+            else:
+                misses.append(symbol)
+
+        raw_payloads = await asyncio.gather(
+            *(asyncio.to_thread(self._fetch_from_client, symbol, **kwargs) for symbol in misses)
+        )
+        for symbol, raw in zip(misses, raw_payloads):
+            normalized = self._normalize(symbol, raw)
+            self.cache.set(self._cache_key(symbol, **kwargs), normalized, self.cache_ttl)
+            quotes[symbol] = normalized
+        if misses:
+            logger.info("Fetched %s data for %d symbols", self.__class__.__name__, len(misses))
+        return [quotes[symbol] for symbol in symbols]
+
 
 class AlphaVantageAdapter(BaseAdapter):
     """Adapter for AlphaVantage time series data."""
@@ -106,25 +155,41 @@ class AlphaVantageAdapter(BaseAdapter):
     def _normalize(self, symbol: str, payload: Mapping[str, Any]) -> NormalizedQuote:
         meta = payload.get("Meta Data", {})
         latest_key, latest_payload = self._latest_entry(payload.get("Time Series (1min)") or payload.get("Time Series (Daily)", {}))
+        metadata: Dict[str, Any] = {"source": "alpha_vantage", "raw_timestamp": latest_key}
+        interval = meta.get("4. Interval")
+        if interval is not None:
+            metadata["interval"] = interval
         return NormalizedQuote(
             symbol=symbol,
-            timestamp=float(latest_payload.get("timestamp") or meta.get("3. Last Refreshed", 0.0)),
+            timestamp=float(latest_payload.get("timestamp", latest_key) or meta.get("3. Last Refreshed", 0.0)),
             open=float(latest_payload.get("1. open", 0.0)),
             high=float(latest_payload.get("2. high", 0.0)),
             low=float(latest_payload.get("3. low", 0.0)),
             close=float(latest_payload.get("4. close", 0.0)),
             volume=float(latest_payload.get("5. volume", latest_payload.get("6. volume", 0.0))),
-            metadata={"source": "alpha_vantage", "interval": meta.get("4. Interval"), "raw_timestamp": latest_key},
+            metadata=metadata,
         )
 
     @staticmethod
     def _latest_entry(series: Mapping[str, Mapping[str, Any]]) -> tuple[str, Mapping[str, Any]]:
         if not series:
             return "", {}
-        latest_key = sorted(series.keys())[-1]
-        payload = dict(series[latest_key])
-        payload.setdefault("timestamp", latest_key)
-        return latest_key, payload
+        latest_key = max(series)
+        return latest_key, series[latest_key]
+
+
+# Well-formed feeds always carry a timestamp, so the C-level itemgetter is tried first and the
+# defaulting key only runs when some entry lacks one.
+_BAR_TIME = itemgetter("t")
+_DATAPOINT_TIME = itemgetter("timestamp")
+
+
+def _bar_time_or_zero(item: Mapping[str, Any]) -> Any:
+    return item.get("t", 0)
+
+
+def _datapoint_time_or_zero(item: Mapping[str, Any]) -> Any:
+    return item.get("timestamp", 0)
 
 
 class PolygonAdapter(BaseAdapter):
@@ -134,7 +199,14 @@ class PolygonAdapter(BaseAdapter):
         results: List[Mapping[str, Any]] = payload.get("results", [])  # type: ignore[assignment]
         if not results:
             return NormalizedQuote(symbol=symbol, timestamp=0.0, open=0.0, high=0.0, low=0.0, close=0.0, volume=0.0, metadata={"source": "polygon"})
-        latest = max(results, key=lambda item: item.get("t", 0))
+        try:
+            latest = max(results, key=_BAR_TIME)
+        except KeyError:
+            latest = max(results, key=_bar_time_or_zero)
+        metadata: Dict[str, Any] = {"source": "polygon", "aggregates_count": payload.get("resultsCount", len(results))}
+        query_count = payload.get("queryCount")
+        if query_count is not None:
+            metadata["query_count"] = query_count
         return NormalizedQuote(
             symbol=symbol,
             timestamp=float(latest.get("t", 0)) / 1000.0,
@@ -143,11 +215,7 @@ class PolygonAdapter(BaseAdapter):
             low=float(latest.get("l", 0.0)),
             close=float(latest.get("c", 0.0)),
             volume=float(latest.get("v", 0.0)),
-            metadata={
-                "source": "polygon",
-                "aggregates_count": payload.get("resultsCount", len(results)),
-                "query_count": payload.get("queryCount"),
-            },
+            metadata=metadata,
         )
 
 
@@ -155,26 +223,35 @@ class AlternativeDataAdapter(BaseAdapter):
     """Adapter that normalizes alternative data feeds (e.g., sentiment, satellite)."""
 
     def _normalize(self, symbol: str, payload: Mapping[str, Any]) -> NormalizedQuote:
-        datapoints = payload.get("data") or []
+        datapoints = payload.get("data")
         if not datapoints:
             return NormalizedQuote(symbol=symbol, timestamp=0.0, open=0.0, high=0.0, low=0.0, close=0.0, volume=0.0, metadata={"source": "alternative"})
-        latest = max(datapoints, key=lambda item: item.get("timestamp", 0))
-        sentiment = latest.get("sentiment", {})
-        price_projection = sentiment.get("projected_price", latest.get("price", 0.0))
+        try:
+            latest = max(datapoints, key=_DATAPOINT_TIME)
+        except KeyError:
+            latest = max(datapoints, key=_datapoint_time_or_zero)
+        get = latest.get
+        sentiment = get("sentiment") or {}
+        price_projection = sentiment.get("projected_price", get("price", 0.0))
+        metadata: Dict[str, Any] = {"source": "alternative"}
+        provider = payload.get("provider")
+        if provider is not None:
+            metadata["provider"] = intern_identifier(provider) if isinstance(provider, str) else provider
+        score = sentiment.get("score")
+        if score is not None:
+            metadata["score"] = score
+        coverage = get("coverage")
+        if coverage is not None:
+            metadata["coverage"] = coverage
         return NormalizedQuote(
             symbol=symbol,
-            timestamp=float(latest.get("timestamp", 0.0)),
-            open=float(latest.get("open", price_projection)),
-            high=float(latest.get("high", price_projection)),
-            low=float(latest.get("low", price_projection)),
-            close=float(latest.get("close", price_projection)),
-            volume=float(latest.get("volume", sentiment.get("volume_estimate", 0.0))),
-            metadata={
-                "source": "alternative",
-                "provider": payload.get("provider"),
-                "score": sentiment.get("score"),
-                "coverage": latest.get("coverage"),
-            },
+            timestamp=float(get("timestamp", 0.0)),
+            open=float(get("open", price_projection)),
+            high=float(get("high", price_projection)),
+            low=float(get("low", price_projection)),
+            close=float(get("close", price_projection)),
+            volume=float(get("volume", sentiment.get("volume_estimate", 0.0))),
+            metadata=metadata,
         )
 
 
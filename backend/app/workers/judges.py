@@ -1,12 +1,42 @@
 """Judge workflows combining LLM reasoning with rule-based validation."""
 from __future__ import annotations
 
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from statistics import mode
-from typing import Iterable, List, Protocol
+from itertools import chain
+from typing import Iterable, List, Optional, Protocol
 
+from backend.app.config import get_settings
 from backend.app.domain.discussion import DiscussionSession, JudgeVerdict
 
+# LLM and validator calls are IO-bound; a shared pool lets one review overlap them without
+# spawning threads per call. It is started by the first review and stopped at app shutdown.
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_settings().judge_max_workers,
+                    thread_name_prefix="committee-judge",
+                )
+    return _executor
+
+
+def shutdown_judge_executor() -> None:
+    """Stop the shared judge pool without blocking; a later review starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
 class LLMClient(Protocol):
     """Minimal abstraction for interacting with an LLM."""
@@ -48,16 +78,16 @@ class CommitteeJudge:
 
     def review(self, session: DiscussionSession) -> JudgeVerdict:
         """Produce a consensus verdict for a discussion session."""
-        llm_summaries = [client.generate_summary(session) for client in self._llm_clients]
-        llm_issues = [client.identify_issues(session) for client in self._llm_clients]
-        validator_flags = [validator.evaluate(session) for validator in self._validators]
-
-        flattened_issues: List[str] = []
-        for issue_list in llm_issues + validator_flags:
-            flattened_issues.extend(issue_list)
+        executor = _get_executor()
+        summary_futures = [executor.submit(client.generate_summary, session) for client in self._llm_clients]
+        issue_futures = [executor.submit(client.identify_issues, session) for client in self._llm_clients]
+        flag_futures = [executor.submit(validator.evaluate, session) for validator in self._validators]
+        llm_summaries = [future.result() for future in summary_futures]
+        llm_issues = [future.result() for future in issue_futures]
+        validator_flags = [future.result() for future in flag_futures]
 
         consensus_summary = self._consensus_summary(llm_summaries)
-        unique_issues = sorted(set(flattened_issues))
+        unique_issues = sorted(set(chain.from_iterable(chain(llm_issues, validator_flags))))
 
         metadata = {
             "summaries": llm_summaries,
@@ -73,10 +103,8 @@ class CommitteeJudge:
 
     def _consensus_summary(self, summaries: Iterable[str]) -> str:
         """Choose a summary based on plurality voting with fallback."""
-        non_empty = [summary.strip() for summary in summaries if summary.strip()]
+        non_empty = [stripped for stripped in (summary.strip() for summary in summaries) if stripped]
         if not non_empty:
             return "No summary available."
-        try:
-            return mode(non_empty)
-        except Exception:
-            return non_empty[0]
+        # Ties resolve to the summary seen first.
+        return Counter(non_empty).most_common(1)[0][0]
@@ -1,17 +1,30 @@
 """Parlant-inspired reflection helpers."""
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from backend.app.domain.discussion import AgentTurn
 from backend.app.workers.socratic import AgentAdapter, ReflectionEngine
 
+_ReflectHook = Callable[[str, str], Iterable[str]]
+
 
 class DefaultReflectionEngine(ReflectionEngine):
     """Reflection engine that defers to the agent when possible."""
 
+    def __init__(self) -> None:
+        self._reflect_hooks: Dict[str, Tuple[AgentAdapter, Optional[_ReflectHook]]] = {}
+
+    def _reflect_hook(self, agent: AgentAdapter) -> Optional[_ReflectHook]:
+        """Return the agent's ``reflect`` callable, probing it the first time the agent is seen."""
+        cached = self._reflect_hooks.get(agent.agent_id)
+        if cached is not None and cached[0] is agent:
+            return cached[1]
+        hook = getattr(agent, "reflect", None)
+        self._reflect_hooks[agent.agent_id] = (agent, hook)
+        return hook
+
     def generate(self, agent: AgentAdapter, turn: AgentTurn) -> Iterable[str]:
-        if hasattr(agent, "reflect"):
-            yield from agent.reflect(turn.prompt, turn.response or "")
-        else:
-            yield from ()
+        reflect = self._reflect_hook(agent)
+        if reflect is not None:
+            yield from reflect(turn.prompt, turn.response or "")
@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Deque, Iterable, List, Protocol
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Protocol, Tuple
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql import Select
 
-from backend.app.core.database import get_session
+from backend.app.core.database import get_async_session, get_session
+from backend.app.core.interning import intern_identifier
 from backend.app.domain.discussion import (
     AgentTurn,
     DiscussionPhase,
@@ -18,9 +22,18 @@ from backend.app.domain.discussion import (
 )
 from backend.app.schemas import models
 
+# Agent responses are IO-bound and run here while reflections are generated on the caller.
+_respond_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-respond")
+
 
 class AgentAdapter(Protocol):
-    """Protocol describing how agents should behave."""
+    """Protocol describing how agents should behave.
+
+    An optional ``respond(prompt, context)`` runs on a worker thread while the turn's tools and
+    ``reflect`` run on the calling thread, so agents that provide it must be safe to call from
+    two threads at once. ``reflect`` is not given the response; it may be called before
+    ``respond`` finishes.
+    """
 
     agent_id: str
 
@@ -47,6 +60,31 @@ class ReflectionEngine(Protocol):
         ...
 
 
+class _PersistedEntity(Protocol):
+    """Domain objects that remember the primary key of the row backing them."""
+
+    record_id: Optional[int]
+
+
+class _RecordRow(Protocol):
+    """ORM rows whose integer primary key is assigned at flush."""
+
+    id: Optional[int]
+
+
+def _select_session_tree(session_id: str) -> Select:
+    """Select a session record with its turns, tools, verdicts, and events eager-loaded."""
+    return (
+        select(models.DiscussionSessionRecord)
+        .where(models.DiscussionSessionRecord.id == session_id)
+        .options(
+            selectinload(models.DiscussionSessionRecord.turns).selectinload(models.AgentTurnRecord.tools),
+            selectinload(models.DiscussionSessionRecord.verdicts),
+            selectinload(models.DiscussionSessionRecord.events),
+        )
+    )
+
+
 class SocraticOrchestrator:
     """Coordinates agents, tools, and judges for a session."""
 
@@ -56,25 +94,55 @@ class SocraticOrchestrator:
         tools: Iterable[ToolAdapter],
         judges: Iterable["JudgeWorker"],
         reflection_engine: ReflectionEngine,
+        on_update: Optional[Callable[[DiscussionSession], None]] = None,
     ) -> None:
         self.agents: Deque[AgentAdapter] = deque(agents)
+        # Capability probes are resolved once per agent rather than on every round.
+        self._respond_hooks: Dict[
+            str, Tuple[AgentAdapter, Optional[Callable[[str, List[str]], str]]]
+        ] = {}
         self.tools = list(tools)
         self.judges = list(judges)
         self.reflection_engine = reflection_engine
+        self.on_update = on_update
+
+    def _respond_hook(self, agent: AgentAdapter) -> Optional[Callable[[str, List[str]], str]]:
+        """Return the agent's ``respond`` callable, probing it the first time the agent is seen."""
+        cached = self._respond_hooks.get(agent.agent_id)
+        if cached is not None and cached[0] is agent:
+            return cached[1]
+        hook = getattr(agent, "respond", None)
+        self._respond_hooks[agent.agent_id] = (agent, hook)
+        return hook
+
+    async def aload_session(self, session_id: str) -> Optional[DiscussionSession]:
+        """Return a persisted session aggregate, or None when it does not exist."""
+        async with get_async_session() as session:
+            result = await session.execute(_select_session_tree(session_id))
+            record = result.scalar_one_or_none()
+            return self._hydrate_session(record) if record else None
 
     def load_or_create_session(self, session_id: str, topic: str) -> DiscussionSession:
         """Return a session aggregate, either from persistence or new."""
         with get_session() as session:
-            record = session.get(models.DiscussionSessionRecord, session_id)
-            if record:
-                return self._hydrate_session(record)
-            record = models.DiscussionSessionRecord(id=session_id, topic=topic)
-            session.add(record)
-            session.flush()
-            return DiscussionSession(session_id=session_id, topic=topic)
+            return self._load_or_create(session, session_id, topic)[0]
+
+    def _load_or_create(
+        self, session: Session, session_id: str, topic: str
+    ) -> Tuple[DiscussionSession, models.DiscussionSessionRecord]:
+        record = session.execute(_select_session_tree(session_id)).scalar_one_or_none()
+        if record:
+            return self._hydrate_session(record), record
+        record = models.DiscussionSessionRecord(id=session_id, topic=topic)
+        session.add(record)
+        session.flush()
+        return DiscussionSession(session_id=session_id, topic=topic), record
 
     def _hydrate_session(self, record: models.DiscussionSessionRecord) -> DiscussionSession:
-        """Reconstruct a discussion session aggregate from persistent data."""
+        """Reconstruct a discussion session aggregate from persistent data.
+
+        Child collections arrive in chronological order via the relationships' ``order_by``.
+        """
         session_model = DiscussionSession(
             session_id=record.id,
             topic=record.topic,
@@ -83,46 +151,47 @@ class SocraticOrchestrator:
         )
 
         session_model.turns.clear()
-        for turn_record in sorted(record.turns, key=lambda tr: tr.created_at):
+        for turn_record in record.turns:
             turn = AgentTurn(
-                agent_id=turn_record.agent_id,
+                agent_id=intern_identifier(turn_record.agent_id),
                 prompt=turn_record.prompt,
                 response=turn_record.response,
-                reflections=tuple(turn_record.reflections or []),
+                reflections=tuple(turn_record.reflections) if turn_record.reflections else (),
                 created_at=turn_record.created_at,
                 completed_at=turn_record.completed_at,
                 tool_results=[],
+                record_id=turn_record.id,
             )
-            turn.record_id = turn_record.id  # type: ignore[attr-defined]
-            for tool_record in sorted(turn_record.tools, key=lambda tool: tool.created_at):
+            for tool_record in turn_record.tools:
                 tool_result = ToolResult(
-                    tool_name=tool_record.tool_name,
+                    tool_name=intern_identifier(tool_record.tool_name),
                     output=tool_record.output,
                     metadata=tool_record.metadata or {},
                     created_at=tool_record.created_at,
+                    record_id=tool_record.id,
                 )
-                tool_result.record_id = tool_record.id  # type: ignore[attr-defined]
                 turn.tool_results.append(tool_result)
             session_model.turns.append(turn)
+            session_model.turn_columns.append(turn)
 
         session_model.judge_events.clear()
-        for verdict_record in sorted(record.verdicts, key=lambda verdict: verdict.created_at):
+        for verdict_record in record.verdicts:
             verdict = JudgeVerdict(
-                judge_id=verdict_record.judge_id,
+                judge_id=intern_identifier(verdict_record.judge_id),
                 summary=verdict_record.summary,
-                open_issues=tuple(verdict_record.open_issues or []),
+                open_issues=tuple(verdict_record.open_issues) if verdict_record.open_issues else (),
                 metadata=verdict_record.metadata or {},
                 created_at=verdict_record.created_at,
+                record_id=verdict_record.id,
             )
-            verdict.record_id = verdict_record.id  # type: ignore[attr-defined]
             session_model.judge_events.append(verdict)
 
         session_model.tool_events.clear()
-        for event_record in sorted(record.events, key=lambda event: event.occurred_at):
+        for event_record in record.events:
             session_model.tool_events.append(
                 PhaseEvent(
                     phase=DiscussionPhase(event_record.phase),
-                    actor=event_record.actor,
+                    actor=intern_identifier(event_record.actor),
                     payload=event_record.payload or {},
                     timestamp=event_record.occurred_at,
                     record_id=event_record.id,
@@ -138,136 +207,168 @@ class SocraticOrchestrator:
 
     def run_round(self, session_id: str, topic: str) -> DiscussionSession:
         """Execute a full discussion round across all agents and judges."""
-        session_model = self.load_or_create_session(session_id, topic)
+        # One ORM session spans the round. It commits after loading so no connection is held
+        # while agents and judges run, and expire_on_commit=False keeps the loaded record
+        # usable by _persist_into without fetching it again.
+        with get_session(expire_on_commit=False) as db:
+            session_model, record = self._load_or_create(db, session_id, topic)
+            db.commit()
+            self._play_round(session_model, topic)
+            self._persist_into(db, session_model, record)
+        self._rotate_agents()
+        if self.on_update is not None:
+            self.on_update(session_model)
+        return session_model
+
+    def _play_round(self, session_model: DiscussionSession, topic: str) -> None:
+        """Run the current agent's turn, its tools and reflections, and the judges."""
         context = [turn.response or "" for turn in session_model.turns]
         agent = self.agents[0]
         prompt = agent.propose(topic, context)
         turn = session_model.start_agent_turn(agent.agent_id, prompt)
-
-        for tool in self.tools:
-            result = tool.invoke(session_model, turn)
-            session_model.record_tool_result(result)
-
-        response = prompt  # fallback if agent reflection modifies prompt
-        reflections = list(self.reflection_engine.generate(agent, turn))
-        if hasattr(agent, "respond"):
-            response = getattr(agent, "respond")(prompt, context)
+        respond = self._respond_hook(agent)
+        pending_response = _respond_executor.submit(respond, prompt, context) if respond else None
+
+        try:
+            for tool in self.tools:
+                result = tool.invoke(session_model, turn)
+                session_model.record_tool_result(result)
+
+            reflections = list(self.reflection_engine.generate(agent, turn))
+        except BaseException:
+            # Do not leave the agent responding in the background after the round has failed.
+            if pending_response is not None and not pending_response.cancel():
+                wait([pending_response])
+            raise
+        # Without a respond hook the prompt stands in as the response.
+        response = pending_response.result() if pending_response else prompt
         session_model.close_agent_turn(response=response, reflections=reflections)
 
         for judge in self.judges:
             verdict = judge.review(session_model)
             session_model.add_judge_verdict(verdict)
 
-        self._persist(session_model)
-        self._rotate_agents()
-        return session_model
-
     def _persist(self, session_model: DiscussionSession) -> None:
         """Persist session state into the relational schema."""
         with get_session() as session:
+            self._persist_into(session, session_model)
+
+    def _persist_into(
+        self,
+        session: Session,
+        session_model: DiscussionSession,
+        record: Optional[models.DiscussionSessionRecord] = None,
+    ) -> None:
+        """Write ``session_model`` through ``session``, reusing ``record`` when already loaded."""
+        if record is None:
             record = session.get(models.DiscussionSessionRecord, session_model.session_id)
-            if not record:
-                record = models.DiscussionSessionRecord(
-                    id=session_model.session_id,
-                    topic=session_model.topic,
-                    created_at=session_model.created_at,
-                    updated_at=session_model.updated_at,
+        if not record:
+            record = models.DiscussionSessionRecord(
+                id=session_model.session_id,
+                topic=session_model.topic,
+                created_at=session_model.created_at,
+                updated_at=session_model.updated_at,
+            )
+            session.add(record)
+        record.topic = session_model.topic
+        record.updated_at = datetime.utcnow()
+
+        turn_records = {
+            tr.id: tr for tr in session.execute(
+                select(models.AgentTurnRecord).where(models.AgentTurnRecord.session_id == record.id)
+            ).scalars()
+        }
+        tool_records = {
+            tool.id: tool for tool in session.execute(
+                select(models.ToolResultRecord)
+                .join(models.AgentTurnRecord)
+                .where(models.AgentTurnRecord.session_id == record.id)
+            ).scalars()
+        }
+        # New rows are flushed together at the end; ids are copied back afterwards.
+        created: List[Tuple[_PersistedEntity, _RecordRow]] = []
+        for turn in session_model.turns:
+            turn_record = turn_records.get(turn.record_id)
+            if not turn_record:
+                turn_record = models.AgentTurnRecord(
+                    session_id=record.id,
+                    agent_id=turn.agent_id,
+                    prompt=turn.prompt,
                 )
-                session.add(record)
-            record.topic = session_model.topic
-            record.updated_at = datetime.utcnow()
-
-            turn_records = {
-                tr.id: tr for tr in session.execute(
-                    select(models.AgentTurnRecord).where(models.AgentTurnRecord.session_id == record.id)
-                ).scalars()
-            }
-            for turn in session_model.turns:
-                turn_record = turn_records.get(getattr(turn, "record_id", None))
-                if not turn_record:
-                    turn_record = models.AgentTurnRecord(
-                        session_id=record.id,
-                        agent_id=turn.agent_id,
-                        prompt=turn.prompt,
+                session.add(turn_record)
+                created.append((turn, turn_record))
+            turn_record.response = turn.response
+            turn_record.reflections = list(turn.reflections)
+            turn_record.completed_at = turn.completed_at
+            turn_record.created_at = turn.created_at
+
+            for tool_result in turn.tool_results:
+                tool_record = tool_records.get(tool_result.record_id)
+                if not tool_record:
+                    tool_record = models.ToolResultRecord(
+                        tool_name=tool_result.tool_name,
+                        output=tool_result.output,
+                        metadata=tool_result.metadata,
+                        created_at=tool_result.created_at,
                     )
-                    session.add(turn_record)
-                    session.flush()
-                    turn.record_id = turn_record.id  # type: ignore[attr-defined]
-                turn_record.response = turn.response
-                turn_record.reflections = list(turn.reflections)
-                turn_record.completed_at = turn.completed_at
-                turn_record.created_at = turn.created_at
-
-                existing_tools = {
-                    tool.id: tool for tool in session.execute(
-                        select(models.ToolResultRecord).where(models.ToolResultRecord.turn_id == turn_record.id)
-                    ).scalars()
-                }
-                for tool_result in turn.tool_results:
-                    tool_record = None
-                    if hasattr(tool_result, "record_id"):
-                        tool_record = existing_tools.get(tool_result.record_id)
-                    if not tool_record:
-                        tool_record = models.ToolResultRecord(
-                            turn_id=turn_record.id,
-                            tool_name=tool_result.tool_name,
-                            output=tool_result.output,
-                            metadata=tool_result.metadata,
-                            created_at=tool_result.created_at,
-                        )
-                        session.add(tool_record)
-                        session.flush()
-                        tool_result.record_id = tool_record.id  # type: ignore[attr-defined]
+                    if turn_record.id is None:
+                        # New turns get their id at flush; link through the relationship.
+                        tool_record.turn = turn_record
                     else:
-                        tool_record.output = tool_result.output
-                        tool_record.metadata = tool_result.metadata
-
-            existing_verdicts = {
-                verdict.id: verdict for verdict in session.execute(
-                    select(models.JudgeVerdictRecord).where(models.JudgeVerdictRecord.session_id == record.id)
-                ).scalars()
-            }
-            for verdict in session_model.judge_events:
-                verdict_record = None
-                if hasattr(verdict, "record_id"):
-                    verdict_record = existing_verdicts.get(verdict.record_id)
-                if not verdict_record:
-                    verdict_record = models.JudgeVerdictRecord(
-                        session_id=record.id,
-                        judge_id=verdict.judge_id,
-                        summary=verdict.summary,
-                        open_issues=list(verdict.open_issues),
-                        metadata=verdict.metadata,
-                        created_at=verdict.created_at,
-                    )
-                    session.add(verdict_record)
-                    session.flush()
-                    verdict.record_id = verdict_record.id  # type: ignore[attr-defined]
+                        tool_record.turn_id = turn_record.id
+                    session.add(tool_record)
+                    created.append((tool_result, tool_record))
                 else:
-                    verdict_record.summary = verdict.summary
-                    verdict_record.open_issues = list(verdict.open_issues)
-                    verdict_record.metadata = verdict.metadata
-
-            existing_event_ids = {
-                evt.id
-                for evt in session.execute(
-                    select(models.EventRecord.id).where(models.EventRecord.session_id == record.id)
-                ).scalars()
-            }
-            for event in session_model.history():
-                if event.record_id in existing_event_ids:
-                    continue
-                event_record = models.EventRecord(
+                    tool_record.output = tool_result.output
+                    tool_record.metadata = tool_result.metadata
+
+        existing_verdicts = {
+            verdict.id: verdict for verdict in session.execute(
+                select(models.JudgeVerdictRecord).where(models.JudgeVerdictRecord.session_id == record.id)
+            ).scalars()
+        }
+        for verdict in session_model.judge_events:
+            verdict_record = existing_verdicts.get(verdict.record_id)
+            if not verdict_record:
+                verdict_record = models.JudgeVerdictRecord(
                     session_id=record.id,
-                    phase=event.phase.value,
-                    actor=event.actor,
-                    payload=event.payload,
-                    occurred_at=event.timestamp,
+                    judge_id=verdict.judge_id,
+                    summary=verdict.summary,
+                    open_issues=list(verdict.open_issues),
+                    metadata=verdict.metadata,
+                    created_at=verdict.created_at,
                 )
-                session.add(event_record)
-                session.flush()
-                event.record_id = event_record.id
-                existing_event_ids.add(event_record.id)
+                session.add(verdict_record)
+                created.append((verdict, verdict_record))
+            else:
+                verdict_record.summary = verdict.summary
+                verdict_record.open_issues = list(verdict.open_issues)
+                verdict_record.metadata = verdict.metadata
+
+        existing_event_ids = set(
+            session.execute(
+                select(models.EventRecord.id).where(models.EventRecord.session_id == record.id)
+            ).scalars()
+        )
+        new_events = [
+            event for event in session_model.history() if event.record_id not in existing_event_ids
+        ]
+        event_records = [
+            models.EventRecord(
+                session_id=record.id,
+                phase=event.phase.value,
+                actor=event.actor,
+                payload=event.payload,
+                occurred_at=event.timestamp,
+            )
+            for event in new_events
+        ]
+        session.add_all(event_records)
+        created.extend(zip(new_events, event_records))
+
+        session.flush()
+        for entity, row in created:
+            entity.record_id = row.id
 
     def _rotate_agents(self) -> None:
         """Rotate the agent queue to ensure turns are round-robin."""